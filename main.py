@@ -1,10 +1,14 @@
 import pygame
 import sys
 import os
+import multiprocessing
 from src.constants import *
 from src.game import Game
 from src.menu import Menu
 from src.game_vs_ai import GameVsAI
+from src.parallel_search import shutdown_pool
+from src.frame_scheduler import FrameScheduler
+from src.render_cache import clear_text_caches, get_font
 
 # Centrer la fenêtre au démarrage
 os.environ['SDL_VIDEO_CENTERED'] = '1'
@@ -173,7 +177,8 @@ def main():
         pygame.init()
         screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Jeu de Dames")
-        clock = pygame.time.Clock()
+        # Images à FPS pendant les animations, attente des événements sinon
+        scheduler = FrameScheduler(FPS)
         menu = Menu()
         theme = menu.get_theme()
         game = None
@@ -189,25 +194,44 @@ def main():
 
         def start_ai(diff):
             nonlocal game_vs_ai, state, theme, difficulty
+            if game_vs_ai:
+                game_vs_ai.cancel_ai()
             theme = menu.get_theme()
             difficulty = diff
             def back_to_menu():
                 nonlocal state, game_vs_ai
                 state = "menu"
+                if game_vs_ai:
+                    game_vs_ai.cancel_ai()
                 game_vs_ai = None
                 menu.reset()
             game_vs_ai = GameVsAI(theme, difficulty, back_to_menu)
+            if difficulty == "hard":
+                # Processus de recherche lancés pendant que le joueur réfléchit à son premier coup
+                game_vs_ai.ai_worker.warm_up()
             state = "ai"
 
         menu.set_callbacks(start_pvp, start_ai, menu.get_theme)
 
         running = True
         while running:
-            dt = clock.tick(FPS) / 1000.0
-            for event in pygame.event.get():
+            view = game if state == "pvp" else game_vs_ai if state == "ai" else None
+            dt, events = scheduler.next_frame(view is not None and view.needs_frames())
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                if event.type == pygame.VIDEORESIZE:
+                    # Tailles de police proportionnelles à la fenêtre : polices et textes à refaire
+                    clear_text_caches()
+                if event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    # Contenu de la fenêtre perdu ou redimensionné : tout redessiner
+                    for view in (game, game_vs_ai):
+                        if view:
+                            view.invalidate()
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    # Arrêter la réflexion de l'IA avant de quitter la partie
+                    if game_vs_ai:
+                        game_vs_ai.cancel_ai()
                     state = "menu"
                     menu.reset()
                 try:
@@ -230,7 +254,7 @@ def main():
                     traceback.print_exc()
                     
             # Police responsive
-            font = pygame.font.SysFont(None, int(screen.get_height() * 0.05), bold=True)
+            font = get_font(None, int(screen.get_height() * 0.05), bold=True)
             
             try:
                 if state == "pvp" and game:
@@ -238,15 +262,21 @@ def main():
                 if state == "ai" and game_vs_ai:
                     game_vs_ai.update(dt)
                 
-                # Rendu
+                # Rendu : le menu est redessiné à chaque image, les parties
+                # seulement là où quelque chose a changé
                 if state == "menu":
                     menu.draw(screen, font)
-                elif state == "pvp" and game:
-                    game.draw(screen, font)
-                elif state == "ai" and game_vs_ai:
-                    game_vs_ai.draw(screen, font)
-                
-                pygame.display.flip()
+                    pygame.display.flip()
+                    # Le menu a recouvert l'écran : la prochaine partie affichée repart d'un dessin complet
+                    for view in (game, game_vs_ai):
+                        if view:
+                            view.invalidate()
+                else:
+                    view = game if state == "pvp" else game_vs_ai
+                    if view:
+                        dirty = view.render(screen, font)
+                        if dirty:
+                            pygame.display.update(dirty)
             except Exception as e:
                 print(f"Erreur lors de la mise à jour ou du rendu: {e}")
                 import traceback
@@ -257,8 +287,11 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        shutdown_pool()
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
+    # Nécessaire pour le pool de processus de l'IA dans l'exécutable PyInstaller
+    multiprocessing.freeze_support()
     main()
@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('src/opening_book.bin', 'src'), ('src/tablebase.bin', 'src')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
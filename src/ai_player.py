@@ -0,0 +1,111 @@
+import random
+
+from src.constants import BOARD_SIZE
+from src import bitboard
+from src.bitboard import square_to_bit
+
+LEVELS = ("easy", "medium", "hard")
+
+
+def promotion_row(color):
+    return BOARD_SIZE - 1 if color == 'noir' else 0
+
+
+def is_protecting_move(position, piece, end_pos):
+    """Vérifie si un mouvement protège une pièce menacée"""
+    # Vérifier si la pièce actuelle est menacée à sa position actuelle
+    if bitboard.is_threatened(position, square_to_bit(piece.row, piece.col), piece.color):
+        return True
+
+    # Vérifier si le mouvement permet de protéger une autre pièce (voisins précalculés)
+    for adj in bitboard.NEIGHBOURS[square_to_bit(*end_pos)]:
+        if adj is not None and position.color_at(adj) == piece.color and bitboard.is_threatened(position, adj, piece.color):
+            return True
+
+    return False
+
+
+def choose_move(board, turn, level, search, color='noir', rng=random):
+    """
+    Choix du coup de l'IA de niveau `level` pour `color`, sans affichage ni
+    animation : retourne (départ, destination, positions prises) ou None si
+    `color` n'a aucun coup. `turn` est l'entrée du cache des coups du tour
+    (`MoveCache.get(color)`), `search` la recherche utilisée au niveau difficile
+    et `rng` la source de hasard des niveaux facile et moyen.
+    """
+    if turn.max_captures > 0:
+        return _choose_capture(board, turn.routes, level, search, color, rng)
+    if not turn.moves:
+        return None
+    if level == "hard":
+        # Approfondissement itératif sous budget de temps (voir AI_TIME_BUDGET)
+        return search.iterative_deepening(color, turn.move_list())
+    if level == "medium":
+        return _choose_medium_move(board, turn.moves, color, rng)
+    # Niveau facile : choix aléatoire
+    all_moves = [(start, end) for start, moves in turn.moves.items() for end in moves]
+    start, end = rng.choice(all_moves)
+    return start, end, []
+
+
+def _choose_capture(board, routes, level, search, color, rng):
+    capture_positions = list(routes)
+    selected = None
+    if level == "hard":
+        # Niveau difficile : la rafle qui donne le meilleur avantage, en jouant les reprises forcées
+        sign = 1 if color == 'noir' else -1
+        best_score = float('-inf')
+        for pos in capture_positions:
+            for route in routes[pos]:
+                end_pos, path, stops = route
+                undo = board.make_move((pos, end_pos, path))
+                score = sign * search.quiesce(float('-inf'), float('inf'), color != 'noir')
+                board.unmake_move(undo)
+                if score > best_score:
+                    best_score = score
+                    selected = (pos, route)
+    elif level == "medium":
+        # Niveau moyen : privilégier les rafles qui donnent une dame ou évitent d'en perdre
+        strategic = []
+        for pos in capture_positions:
+            piece = board.get_piece(pos[0], pos[1])
+            for route in routes[pos]:
+                end_pos = route[0]
+                if end_pos[0] == promotion_row(color) and not piece.king:
+                    priority = 3
+                elif is_protecting_move(board.position, piece, end_pos):
+                    priority = 2
+                else:
+                    priority = 1
+                strategic.append((pos, route, priority))
+        highest = max(priority for _, _, priority in strategic)
+        pos, route, _ = rng.choice([option for option in strategic if option[2] == highest])
+        selected = (pos, route)
+    if selected is None:
+        # Niveau facile (ou repli) : choix aléatoire
+        pos = rng.choice(capture_positions)
+        selected = (pos, rng.choice(routes[pos]))
+    pos, (end_pos, path, stops) = selected
+    return pos, end_pos, path
+
+
+def _choose_medium_move(board, moves, color, rng):
+    """Stratégie du niveau moyen : favoriser la promotion et l'avancement des pions."""
+    forward = 1 if color == 'noir' else -1
+    strategic = []
+    for start_pos, destinations in moves.items():
+        piece = board.get_piece(start_pos[0], start_pos[1])
+        for end_pos in destinations:
+            advance = (end_pos[0] - start_pos[0]) * forward
+            if end_pos[0] == promotion_row(color) and not piece.king:
+                priority = 5
+            elif not piece.king and advance > 0:
+                priority = 3 + advance
+            elif is_protecting_move(board.position, piece, end_pos):
+                priority = 2
+            else:
+                priority = 1
+            strategic.append((start_pos, end_pos, priority))
+    highest = max(priority for _, _, priority in strategic)
+    start_pos, end_pos, _ = rng.choice([move for move in strategic if move[2] == highest])
+    return start_pos, end_pos, []
@@ -0,0 +1,98 @@
+import threading
+
+from src.ai_player import choose_move
+from src.board import Board
+from src.move_cache import MoveCache
+from src.search import Search
+from src.parallel_search import ParallelSearch, warm_up_pool, worker_count
+
+
+class AIWorker:
+    """
+    Lance la réflexion de l'IA (`ai_player.choose_move` : rafles jugées par
+    quiescence, autres coups par approfondissement itératif) dans un thread
+    d'arrière-plan, sur une copie de la position, pour que la boucle de rendu
+    continue (animations, événements) pendant la réflexion. Le jeu interroge
+    `done` à chaque frame puis récupère le coup avec `take_result`.
+    """
+    def __init__(self, tt=None, workers=None):
+        self.tt = tt
+        # Plusieurs cœurs : recherche parallèle à la racine via le pool de processus
+        self.workers = worker_count(workers)
+        self.search = None
+        self.thread = None
+        self.key = None
+        self.result = None
+        self.done = False
+
+    def warm_up(self):
+        """
+        Démarre les processus de la recherche parallèle dès le début de la
+        partie, pour que le premier coup de l'IA ne paie pas leur lancement.
+        """
+        if self.workers > 1:
+            warm_up_pool(self.workers)
+
+    @property
+    def running(self):
+        return self.search is not None and not self.done
+
+    def start(self, board, color='noir', turn=None, level='hard'):
+        """
+        Démarre le choix du coup de `level` pour `color` sur un instantané de
+        `board`. `turn` : coups du tour lus dans le cache (`MoveCache.get`),
+        recalculés sur l'instantané par défaut.
+        """
+        self.cancel()
+        snapshot = Board.from_position(board.position)
+        if turn is None:
+            turn = MoveCache(snapshot).get(color)
+        if self.workers > 1 and not turn.max_captures:
+            search = ParallelSearch(snapshot, self.tt, workers=self.workers)
+        else:
+            search = Search(snapshot, self.tt)
+        self.search = search
+        self.key = board.position_key(color)
+
+        def run():
+            try:
+                move = choose_move(snapshot, turn, level, search, color)
+            except Exception as e:
+                print(f"Error in AI search thread: {e}")
+                move = None
+            # Ignorer le résultat si la recherche a été annulée entre-temps
+            if self.search is search and not search.stop_requested:
+                self.result = move
+                self.done = True
+
+        self.thread = threading.Thread(target=run, name="ia-recherche", daemon=True)
+        self.thread.start()
+
+    def matches(self, board, color='noir'):
+        """Vrai si la recherche lancée (en cours ou terminée) porte sur la position de `board`."""
+        return self.search is not None and board.position_key(color) == self.key
+
+    def take_result(self, board, color='noir'):
+        """
+        Retourne le coup trouvé s'il correspond toujours à la position de `board`,
+        sinon None. Le résultat n'est rendu qu'une fois.
+        """
+        if not self.done:
+            return None
+        move = self.result if board.position_key(color) == self.key else None
+        self.search = None
+        self.thread = None
+        self.result = None
+        self.done = False
+        return move
+
+    def cancel(self):
+        """
+        Arrête la recherche en cours (le thread se termine au prochain contrôle du budget).
+        """
+        if self.search is not None:
+            self.search.stop()
+        self.search = None
+        self.thread = None
+        self.result = None
+        self.done = False
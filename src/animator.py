@@ -1,6 +1,7 @@
-import pygame
 import time
 
+from src.render_cache import piece_atlas
+
 class PieceAnimator:
     """
     Classe représentant l'animation d'une pièce.
@@ -94,19 +95,14 @@ class PieceAnimator:
         if self.active and self.piece:
             try:
                 # Dessine la pièce animée à sa position interpolée
-                color = theme["pion_noir"] if self.piece.color == 'noir' else theme["pion_blanc"]
-                
                 # Vérifier que les coordonnées sont valides
                 if self.piece.anim_x is None or self.piece.anim_y is None:
                     print("Invalid animation coordinates")
                     self.force_complete()
                     return
                     
-                pygame.draw.circle(screen, color, (self.piece.anim_x, self.piece.anim_y), self.square_size//2 - 6)
-                pygame.draw.circle(screen, (255,255,255), (self.piece.anim_x, self.piece.anim_y), self.square_size//2 - 6, 2)
-                if self.piece.king:
-                    pygame.draw.circle(screen, (255, 215, 0), (self.piece.anim_x, self.piece.anim_y), self.square_size//2 - 18)
-                    pygame.draw.circle(screen, (255,255,255), (self.piece.anim_x, self.piece.anim_y), self.square_size//2 - 18, 2)
+                atlas = piece_atlas(theme, self.square_size)
+                screen.blit(*atlas.piece(self.piece.color, self.piece.king, self.piece.anim_x, self.piece.anim_y, moving=True))
             except Exception as e:
                 print(f"Error drawing animation: {e}")
                 self.force_complete() 
\ No newline at end of file
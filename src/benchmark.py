@@ -0,0 +1,362 @@
+"""
+Banc d'essai des chemins critiques du moteur et du rendu, sans fenêtre
+(pilote vidéo SDL « dummy »), sur un corpus fixe de positions.
+
+    python -m src.benchmark                          # tout, résultats dans benchmark.json
+    python -m src.benchmark --only minimax --repeat 10
+    python -m src.benchmark --output new.json --compare old.json
+
+Chaque mesure est précédée de tours d'échauffement ; un échantillon est le
+temps d'un passage sur tout le corpus, ramené à un appel. Les statistiques
+(min, médiane, moyenne, écart type, max) sont écrites en JSON avec le commit
+et la machine, pour comparer deux commits : `--compare` signale les mesures
+dont la médiane s'est dégradée de plus de `--threshold` et retourne alors un
+code de sortie non nul.
+"""
+import os
+
+# Avant l'import de pygame : pas de fenêtre ni de son
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+import pygame
+
+from src.constants import *
+from src.bitboard import position_from_fen
+from src.ai_player import choose_move
+from src.board import Board
+from src.game import Game
+from src.game_vs_ai import GameVsAI
+from src.parallel_search import ParallelSearch, shutdown_pool, warm_up_pool
+from src.perft import REFERENCE_COUNTS
+from src.render_cache import get_font
+from src.search import Search
+from src.transposition import TranspositionTable
+
+# Corpus : positions du perft (ouverture, rafles, dames) et positions de parties
+# aléatoires à graine fixe, du milieu de partie à la finale. Ne pas modifier sans
+# renoncer à la comparaison avec les résultats déjà enregistrés.
+CORPUS = [(name, fen) for name, fen, _ in REFERENCE_COUNTS] + [
+    ("ouverture jouée", "W:W21,34,35,36,37,39,41,43,44,45,46,47,48,49,50:B1,2,3,4,5,7,8,9,11,13,14,15,20,23"),
+    ("prise imposée", "W:W34,39,41,42,44,45,46,47,50:B2,3,4,5,6,9,10,15,17,20,21,26,31,43"),
+    ("dame blanche", "W:WK15,24,39,44,45,46,48,49,50:B1,6,17,18,27,38"),
+    ("fin de milieu de partie", "W:W22,32,34,38,39,41,44:B2,5,6,8,9,11,15,19,25,26"),
+    ("prise noire", "B:W32,41,43,44,45,46,47,48,49:B1,2,5,6,7,8,9,13,14,15,17,25,26,27,30"),
+    ("finale", "B:W28,35,44,45,50:B5,6,11,13,14,18,24,25,27"),
+]
+
+WINDOW_SIZE = (1103, 712)  # taille de la fenêtre au lancement (voir main.py)
+MINIMAX_DEPTHS = (1, 2, 3, 4)
+DIFFICULTIES = ("easy", "medium", "hard")
+# Le niveau difficile est borné en nœuds et non en temps pour être reproductible
+HARD_NODE_BUDGET = 20000
+SEED = 0
+# Mise à l'échelle de la recherche parallèle : recherche à profondeur fixe, seule
+# (1 processus) puis avec des pools de plus en plus grands, sur des milieux de partie
+SCALING_DEPTH = 5
+SCALING_WORKERS = (1,) + tuple(sorted({2, 4, os.cpu_count() or 1} - {1}))
+SCALING_CORPUS = [(name, fen) for name, fen in CORPUS
+                  if name in ("position de départ", "milieu de partie", "ouverture jouée", "fin de milieu de partie")]
+
+
+def _load(game, fen):
+    """Place la position `fen` dans une partie (via son contrôleur)."""
+    game.controller.set_position(*position_from_fen(fen))
+    return game
+
+
+def _select_first_piece(game, square_size):
+    """Sélectionne par un clic la première pièce jouable (surlignages à dessiner)."""
+    turn = game.move_cache.get(game.current_player)
+    if turn.moves:
+        row, col = min(turn.moves)
+        game.handle_click(col * square_size + square_size // 2, row * square_size + square_size // 2, *WINDOW_SIZE)
+
+
+# --- Cas mesurés : fonction(fen) -> (appel préparé, nombre d'appels par échantillon) ---
+# La préparation (construction du plateau, vidage des tables) n'est pas chronométrée.
+
+def case_get_all_moves(fen):
+    position, color = position_from_fen(fen)
+    board = Board.from_position(position)
+    return (lambda: board.get_all_moves(color)), 20
+
+
+def case_get_all_possible_captures(fen):
+    position, color = position_from_fen(fen)
+    board = Board.from_position(position)
+    return (lambda: board.get_all_possible_captures(color)), 20
+
+
+def case_get_all_captures(fen):
+    position, color = position_from_fen(fen)
+    board = Board.from_position(position)
+    pieces = list(board.pieces[color])
+
+    def run():
+        for piece in pieces:
+            board._get_all_captures(piece)
+    return run, 10
+
+
+def case_evaluate_board(fen):
+    game = _load(GameVsAI(THEMES[0], "hard", lambda: None), fen)
+    return game.evaluate_board, 1000
+
+
+def case_minimax(depth):
+    def case(fen):
+        game = _load(GameVsAI(THEMES[0], "hard", lambda: None), fen)
+        game.search.tt.clear()
+        game.search.orderer.clear()
+        maximizing = game.current_player == 'noir'
+        return (lambda: game.minimax(depth, float('-inf'), float('inf'), maximizing)), 1
+    return case
+
+
+def case_jouer_ia(niveau):
+    def case(fen):
+        position, _ = position_from_fen(fen)
+        game = GameVsAI(THEMES[0], niveau, lambda: None)
+        game.controller.set_position(position, 'noir')
+        game.search.time_budget = None
+        game.search.node_budget = HARD_NODE_BUDGET
+        random.seed(SEED)
+        if niveau == "hard":
+            # jouer_ia ne fait que relever le coup du thread de réflexion : on mesure
+            # le choix que ce thread exécute, sous le budget de nœuds fixe
+            turn = game.move_cache.get('noir')
+            return (lambda: choose_move(game.board, turn, niveau, game.search, 'noir')), 1
+        return (lambda: game.jouer_ia(niveau)), 1
+    return case
+
+
+def case_search_scaling(workers):
+    """
+    Recherche complète à SCALING_DEPTH : `Search` seule pour un processus,
+    sinon `ParallelSearch` sur un pool relancé avant chaque mesure (tables de
+    transposition des processus vides, lancement non chronométré).
+    """
+    def case(fen):
+        position, color = position_from_fen(fen)
+        board = Board.from_position(position)
+        if workers == 1:
+            search = Search(board, TranspositionTable(), time_budget=None, node_budget=None, max_depth=SCALING_DEPTH)
+        else:
+            shutdown_pool()
+            warm_up_pool(workers, block=True)
+            search = ParallelSearch(board, TranspositionTable(), workers=workers, time_budget=None, max_depth=SCALING_DEPTH)
+        return (lambda: search.iterative_deepening(color)), 1
+    case.corpus = SCALING_CORPUS
+    return case
+
+
+def scaling(results, out=sys.stdout):
+    """
+    Accélération de la recherche parallèle par rapport à la recherche seule
+    ({processus: accélération}), affichée avec l'efficacité par processus.
+    """
+    serial = results.get("ParallelSearch[1]")
+    speedups = {}
+    if serial is None:
+        return speedups
+    for workers in SCALING_WORKERS[1:]:
+        stats = results.get(f"ParallelSearch[{workers}]")
+        if stats is None or not stats['median']:
+            continue
+        speedups[workers] = serial['median'] / stats['median']
+        print(f"{workers:>3} processus : accélération x{speedups[workers]:.2f}  "
+              f"(efficacité {speedups[workers] / workers:.0%}, {os.cpu_count()} cœurs)", file=out)
+    return speedups
+
+
+def case_draw(game_class, screen, font):
+    square_size = min(WINDOW_SIZE[0] - PANEL_WIDTH, WINDOW_SIZE[1]) // BOARD_SIZE
+
+    def case(fen):
+        if game_class is GameVsAI:
+            game = GameVsAI(THEMES[0], "medium", lambda: None)
+        else:
+            game = Game(THEMES[0])
+        _load(game, fen)
+        _select_first_piece(game, square_size)
+        return (lambda: game.draw(screen, font)), 20
+    return case
+
+
+def case_render_idle(game_class, screen, font):
+    """Image sans changement (joueur qui réfléchit) : relevé de l'état, rien à redessiner."""
+    square_size = min(WINDOW_SIZE[0] - PANEL_WIDTH, WINDOW_SIZE[1]) // BOARD_SIZE
+
+    def case(fen):
+        if game_class is GameVsAI:
+            game = GameVsAI(THEMES[0], "medium", lambda: None)
+        else:
+            game = Game(THEMES[0])
+        _load(game, fen)
+        _select_first_piece(game, square_size)
+        game.render(screen, font)
+        return (lambda: game.render(screen, font)), 50
+    return case
+
+
+def build_cases(screen, font):
+    """[(nom, cas)] dans l'ordre d'exécution."""
+    cases = [
+        ("Board.get_all_moves", case_get_all_moves),
+        ("Board.get_all_possible_captures", case_get_all_possible_captures),
+        ("Board._get_all_captures", case_get_all_captures),
+        ("GameVsAI.evaluate_board", case_evaluate_board),
+    ]
+    cases += [(f"GameVsAI.minimax[{depth}]", case_minimax(depth)) for depth in MINIMAX_DEPTHS]
+    cases += [(f"GameVsAI.jouer_ia[{niveau}]", case_jouer_ia(niveau)) for niveau in DIFFICULTIES]
+    cases += [(f"ParallelSearch[{workers}]", case_search_scaling(workers)) for workers in SCALING_WORKERS]
+    cases += [
+        ("Game.draw", case_draw(Game, screen, font)),
+        ("GameVsAI.draw", case_draw(GameVsAI, screen, font)),
+        ("Game.render[idle]", case_render_idle(Game, screen, font)),
+        ("GameVsAI.render[idle]", case_render_idle(GameVsAI, screen, font)),
+    ]
+    return cases
+
+
+def measure(case, corpus=CORPUS, warmup=1, repeat=5):
+    """
+    Chronomètre `case` sur le corpus (le sien s'il en a un, `case.corpus`) :
+    `warmup` passages ignorés puis `repeat` échantillons. Retourne les
+    statistiques en secondes par appel.
+    """
+    corpus = getattr(case, 'corpus', corpus)
+    samples = []
+    for index in range(warmup + repeat):
+        elapsed = 0.0
+        calls = 0
+        for _, fen in corpus:
+            run, number = case(fen)
+            # Comme timeit : ramasse-miettes arrêté pendant la mesure
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                for _ in range(number):
+                    run()
+                elapsed += time.perf_counter() - start
+            finally:
+                gc.enable()
+            calls += number
+        if index >= warmup:
+            samples.append(elapsed / calls)
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.fmean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'max': max(samples),
+        'calls': calls,
+        'samples': samples,
+    }
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def compare(results, baseline, threshold, out=sys.stdout):
+    """
+    Compare les médianes à celles d'un fichier de résultats précédent.
+    Retourne la liste des mesures dégradées de plus de `threshold` (0.1 = 10 %).
+    """
+    regressions = []
+    for name, stats in results.items():
+        old = baseline.get(name)
+        if old is None or not old['median']:
+            continue
+        ratio = stats['median'] / old['median']
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  RÉGRESSION"
+        print(f"{name:<36} {old['median'] * 1e6:>12.1f} µs -> {stats['median'] * 1e6:>12.1f} µs  x{ratio:.2f}{flag}", file=out)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark", description="Banc d'essai du moteur et du rendu (sans fenêtre).")
+    parser.add_argument('--output', default='benchmark.json', help="fichier JSON des résultats (défaut : benchmark.json)")
+    parser.add_argument('--repeat', type=int, default=5, help="échantillons par mesure (défaut : 5)")
+    parser.add_argument('--warmup', type=int, default=1, help="passages d'échauffement ignorés (défaut : 1)")
+    parser.add_argument('--only', action='append', default=[], help="ne mesure que les cas dont le nom contient ce texte (répétable)")
+    parser.add_argument('--compare', metavar='BASELINE', help="fichier JSON d'un run précédent à comparer")
+    parser.add_argument('--threshold', type=float, default=0.10, help="dégradation de la médiane tolérée avec --compare (défaut : 0.10)")
+    args = parser.parse_args(argv)
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error("--repeat doit être au moins 1 et --warmup positif")
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare, encoding='utf-8') as f:
+                baseline = json.load(f)['results']
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"résultats de référence illisibles ({args.compare}) : {e}")
+
+    pygame.init()
+    try:
+        screen = pygame.display.set_mode(WINDOW_SIZE)
+        font = get_font(None, int(WINDOW_SIZE[1] * 0.05), bold=True)
+        results = {}
+        for name, case in build_cases(screen, font):
+            if args.only and not any(part in name for part in args.only):
+                continue
+            stats = measure(case, warmup=args.warmup, repeat=args.repeat)
+            results[name] = stats
+            print(f"{name:<36} médiane {stats['median'] * 1e6:>12.1f} µs  "
+                  f"min {stats['min'] * 1e6:>12.1f} µs  écart type {stats['stdev'] * 1e6:>10.1f} µs")
+        speedups = scaling(results)
+    finally:
+        shutdown_pool()
+        pygame.quit()
+
+    report = {
+        'commit': _git_commit(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'machine': f"{platform.system()} {platform.machine()}",
+        'corpus': [name for name, _ in CORPUS],
+        'warmup': args.warmup,
+        'repeat': args.repeat,
+        'unit': 's',
+        'results': results,
+        'scaling': {str(workers): speedup for workers, speedup in speedups.items()},
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nRésultats écrits dans {args.output}")
+
+    if baseline is not None:
+        print()
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} régression(s) au-delà de {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
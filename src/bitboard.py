@@ -0,0 +1,616 @@
+"""
+Moteur bitboard pour les 50 cases jouables du plateau.
+
+Les cases foncées sont rangées dans un entier de 55 bits : chaque paire de
+rangées occupe 11 bits (5 cases de la rangée paire, 5 cases de la rangée
+impaire, puis une case fantôme). Avec ce découpage, les quatre diagonales
+correspondent à des décalages constants (-6, -5, +5, +6) et les cases
+fantômes arrêtent naturellement les rayons sur les bords du plateau.
+
+Règles appliquées : dame limitée à 3 cases en déplacement simple, prise à
+distance pour la dame avec atterrissage juste derrière la pièce prise, pièces
+prises laissées sur le plateau jusqu'à la fin de la rafle, prise maximale
+obligatoire. `capture_routes` est la source unique des prises : une entrée par
+rafle maximale, que reprennent `iter_captures`, `iter_moves`, `Board` et le
+cache des coups du tour.
+"""
+import random
+import threading
+
+from src.constants import BOARD_SIZE
+
+NUM_BITS = 55
+
+# Décalages diagonaux, dans le même ordre que [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+UP_LEFT = -6
+UP_RIGHT = -5
+DOWN_LEFT = 5
+DOWN_RIGHT = 6
+DIRECTIONS = (UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT)
+FORWARD_DIRECTIONS = {'blanc': (UP_LEFT, UP_RIGHT), 'noir': (DOWN_LEFT, DOWN_RIGHT)}
+
+# Portée maximale d'une dame en déplacement simple
+KING_MAX_STEPS = 3
+
+# Tables de correspondance case <-> bit
+SQUARE_TO_BIT = {}
+BIT_TO_SQUARE = [None] * NUM_BITS
+for _row in range(BOARD_SIZE):
+    for _col in range(BOARD_SIZE):
+        if (_row + _col) % 2 == 1:
+            _bit = (_row // 2) * 11 + (_row % 2) * 5 + _col // 2
+            SQUARE_TO_BIT[(_row, _col)] = _bit
+            BIT_TO_SQUARE[_bit] = (_row, _col)
+
+VALID_MASK = 0
+for _bit in SQUARE_TO_BIT.values():
+    VALID_MASK |= 1 << _bit
+
+ROW_MASKS = [0] * BOARD_SIZE
+for (_row, _col), _bit in SQUARE_TO_BIT.items():
+    ROW_MASKS[_row] |= 1 << _bit
+
+# Rangée de promotion de chaque camp
+PROMOTION_MASK = {'blanc': ROW_MASKS[0], 'noir': ROW_MASKS[BOARD_SIZE - 1]}
+
+# Position de départ : 4 rangées de pions noirs en haut, 4 rangées de blancs en bas
+INITIAL_BLACK = ROW_MASKS[0] | ROW_MASKS[1] | ROW_MASKS[2] | ROW_MASKS[3]
+INITIAL_WHITE = ROW_MASKS[6] | ROW_MASKS[7] | ROW_MASKS[8] | ROW_MASKS[9]
+
+# Tables précalculées à l'import, pour chaque case jouable et chaque direction
+# (dans l'ordre de DIRECTIONS) :
+#   RAYS[bit][k]       : cases de la diagonale, de la plus proche au bord
+#   NEIGHBOURS[bit][k] : case voisine (None au bord)
+#   JUMPS[bit][k]      : paire (case sautée, case d'atterrissage) d'un saut court, ou None
+# La case opposée à la direction k est dans la direction 3 - k.
+DIRECTION_STEPS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+RAYS = [None] * NUM_BITS
+NEIGHBOURS = [None] * NUM_BITS
+JUMPS = [None] * NUM_BITS
+for (_row, _col), _bit in SQUARE_TO_BIT.items():
+    _rays = []
+    for _dr, _dc in DIRECTION_STEPS:
+        _ray = []
+        _r, _c = _row + _dr, _col + _dc
+        while 0 <= _r < BOARD_SIZE and 0 <= _c < BOARD_SIZE:
+            _ray.append(SQUARE_TO_BIT[(_r, _c)])
+            _r += _dr
+            _c += _dc
+        _rays.append(tuple(_ray))
+    RAYS[_bit] = tuple(_rays)
+    NEIGHBOURS[_bit] = tuple(_ray[0] if _ray else None for _ray in _rays)
+    JUMPS[_bit] = tuple((_ray[0], _ray[1]) if len(_ray) > 1 else None for _ray in _rays)
+
+# Voisins vers l'avant des pions de chaque camp (déplacement simple)
+FORWARD_NEIGHBOURS = {
+    'blanc': [tuple(n for n in (NEIGHBOURS[b][0], NEIGHBOURS[b][1]) if n is not None) if NEIGHBOURS[b] else () for b in range(NUM_BITS)],
+    'noir': [tuple(n for n in (NEIGHBOURS[b][2], NEIGHBOURS[b][3]) if n is not None) if NEIGHBOURS[b] else () for b in range(NUM_BITS)],
+}
+
+
+# Clés de Zobrist : une clé 64 bits par (type de pièce, case) et une pour le trait aux noirs.
+# Types : 0 = pion blanc, 1 = dame blanche, 2 = pion noir, 3 = dame noire.
+_zobrist_rng = random.Random(0x5EED)
+ZOBRIST = [[_zobrist_rng.getrandbits(64) for _ in range(NUM_BITS)] for _ in range(4)]
+ZOBRIST_BLACK_TO_MOVE = _zobrist_rng.getrandbits(64)
+
+
+def _kind(color, king):
+    return (0 if color == 'blanc' else 2) + (1 if king else 0)
+
+
+def zobrist_hash(white, black, kings):
+    """Calcule la clé de Zobrist complète d'une position (sans le trait)."""
+    h = 0
+    for bit in iter_bits(white):
+        h ^= ZOBRIST[_kind('blanc', (kings >> bit) & 1)][bit]
+    for bit in iter_bits(black):
+        h ^= ZOBRIST[_kind('noir', (kings >> bit) & 1)][bit]
+    return h
+
+
+def square_to_bit(row, col):
+    """Retourne l'indice de bit d'une case foncée, ou None pour une case claire."""
+    return SQUARE_TO_BIT.get((row, col))
+
+
+def bit_to_square(bit):
+    """Retourne la case (row, col) correspondant à un indice de bit."""
+    return BIT_TO_SQUARE[bit]
+
+
+def on_board(bit):
+    return bit >= 0 and (VALID_MASK >> bit) & 1
+
+
+def iter_bits(mask):
+    """Parcourt les bits à 1 d'un masque, du plus faible au plus fort (ordre ligne par ligne)."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def shift(mask, direction):
+    """Décale un masque d'un pas dans une direction en éliminant les cases fantômes."""
+    if direction > 0:
+        return (mask << direction) & VALID_MASK
+    return (mask >> -direction) & VALID_MASK
+
+
+def opponent(color):
+    return 'noir' if color == 'blanc' else 'blanc'
+
+
+class Position:
+    """
+    Position sous forme de trois masques : pièces blanches, pièces noires et dames.
+    `hash` est la clé de Zobrist, mise à jour incrémentalement par `put` et `clear`.
+    """
+    __slots__ = ('white', 'black', 'kings', 'hash')
+
+    def __init__(self, white=0, black=0, kings=0):
+        self.white = white
+        self.black = black
+        self.kings = kings
+        self.hash = zobrist_hash(white, black, kings)
+
+    @classmethod
+    def initial(cls):
+        return cls(INITIAL_WHITE, INITIAL_BLACK, 0)
+
+    def copy(self):
+        pos = Position.__new__(Position)
+        pos.white, pos.black, pos.kings, pos.hash = self.white, self.black, self.kings, self.hash
+        return pos
+
+    def __eq__(self, other):
+        return (isinstance(other, Position) and self.white == other.white
+                and self.black == other.black and self.kings == other.kings)
+
+    def __repr__(self):
+        return f"Position(white={self.white:#x}, black={self.black:#x}, kings={self.kings:#x})"
+
+    @property
+    def occupied(self):
+        return self.white | self.black
+
+    @property
+    def empty(self):
+        return VALID_MASK & ~(self.white | self.black)
+
+    def pieces(self, color):
+        return self.white if color == 'blanc' else self.black
+
+    def color_at(self, bit):
+        if (self.white >> bit) & 1:
+            return 'blanc'
+        if (self.black >> bit) & 1:
+            return 'noir'
+        return None
+
+    def is_king(self, bit):
+        return bool((self.kings >> bit) & 1)
+
+    def key(self, color):
+        """Clé de transposition : position + trait."""
+        return self.hash ^ ZOBRIST_BLACK_TO_MOVE if color == 'noir' else self.hash
+
+    def put(self, bit, color, king=False):
+        mask = 1 << bit
+        if (self.white | self.black) & mask:
+            self.clear(bit)
+        if color == 'blanc':
+            self.white |= mask
+        else:
+            self.black |= mask
+        if king:
+            self.kings |= mask
+        self.hash ^= ZOBRIST[_kind(color, king)][bit]
+
+    def clear(self, bit):
+        mask = 1 << bit
+        if self.white & mask:
+            self.hash ^= ZOBRIST[_kind('blanc', self.kings & mask)][bit]
+        elif self.black & mask:
+            self.hash ^= ZOBRIST[_kind('noir', self.kings & mask)][bit]
+        else:
+            return
+        self.white &= ~mask
+        self.black &= ~mask
+        self.kings &= ~mask
+
+    def move(self, start, end):
+        """Déplace la pièce de `start` vers `end` et applique la promotion éventuelle."""
+        color = self.color_at(start)
+        king = self.is_king(start)
+        self.clear(start)
+        if not king and (PROMOTION_MASK[color] >> end) & 1:
+            king = True
+        self.put(end, color, king)
+
+
+def quiet_moves(pos, origin):
+    """Liste des destinations de déplacement simple (sans prise) d'une pièce."""
+    empty = pos.empty
+    if pos.is_king(origin):
+        moves = []
+        for ray in RAYS[origin]:
+            for target in ray[:KING_MAX_STEPS]:
+                if not (empty >> target) & 1:
+                    break
+                moves.append(target)
+        return moves
+    return [target for target in FORWARD_NEIGHBOURS[pos.color_at(origin)][origin] if (empty >> target) & 1]
+
+
+def _capture_context(pos, origin):
+    if (pos.white >> origin) & 1:
+        return pos.black, pos.white | pos.black
+    return pos.white, pos.white | pos.black
+
+
+def _first_piece(ray, occupied, is_king):
+    """
+    Indice sur le rayon de la première case occupée que la pièce peut atteindre
+    (la voisine pour un pion, n'importe quelle distance pour une dame), ou -1.
+    """
+    if not is_king:
+        return 0 if ray and (occupied >> ray[0]) & 1 else -1
+    for i, target in enumerate(ray):
+        if (occupied >> target) & 1:
+            return i
+    return -1
+
+
+class _CaptureBuffers(threading.local):
+    """
+    Tampons préalloués de la recherche de rafles, un jeu par thread (le thread
+    de l'IA et la boucle de rendu peuvent chercher en même temps). Les nœuds de
+    l'arbre de rafle sont rangés dans des tableaux parallèles et désignés par
+    leur indice : aucun tuple ni ensemble n'est créé pendant le parcours.
+    """
+    def __init__(self):
+        self.bits = []    # case d'atterrissage du nœud
+        self.taken = []   # masque des pièces prises
+        self.parent = []  # nœud précédent (-1 pour l'origine)
+        self.target = []  # pièce prise pour arriver au nœud
+        self.stack = []   # pile explicite d'indices de nœuds
+        self.size = 0
+        self.grow(256)
+
+    def grow(self, size):
+        """Agrandit les tableaux sur place (les références locales restent valides)."""
+        extra = [0] * (size - self.size)
+        for array in (self.bits, self.taken, self.parent, self.target, self.stack):
+            array.extend(extra)
+        self.size = size
+
+
+_capture_buffers = _CaptureBuffers()
+
+
+def _captured_of(buffers, node):
+    """Bits pris dans l'ordre pour arriver au nœud `node`."""
+    parent, target = buffers.parent, buffers.target
+    captured = []
+    while parent[node] >= 0:
+        captured.append(target[node])
+        node = parent[node]
+    captured.reverse()
+    return tuple(captured)
+
+
+def _stops_of(buffers, node):
+    """Cases d'atterrissage successives pour arriver au nœud `node`."""
+    parent, bits = buffers.parent, buffers.bits
+    stops = []
+    while parent[node] >= 0:
+        stops.append(bits[node])
+        node = parent[node]
+    stops.reverse()
+    return tuple(stops)
+
+
+def _capture_tree(pos, origin):
+    """
+    Parcours en profondeur (pile explicite, ordre LIFO) de l'arbre des rafles
+    d'une pièce. Les nœuds sont écrits dans les tampons du thread courant ; les
+    pièces prises sont suivies dans un masque et les doublons éliminés sur le
+    couple (atterrissage, masque), encodé dans un seul entier.
+
+    Retourne (tampons, nœuds terminaux) : chaque nœud terminal est une rafle
+    complète, dont le nombre de prises est `taken[nœud].bit_count()`. Les
+    chemins ne sont reconstitués qu'ensuite, pour les seuls nœuds demandés.
+    """
+    opp, occupied = _capture_context(pos, origin)
+    is_king = pos.is_king(origin)
+    buffers = _capture_buffers
+    bits, takens, parents, targets, stack = buffers.bits, buffers.taken, buffers.parent, buffers.target, buffers.stack
+    size = buffers.size
+    bits[0], takens[0], parents[0] = origin, 0, -1
+    count = 1
+    stack[0] = 0
+    top = 1
+    visited = set()
+    terminal = []
+    while top:
+        top -= 1
+        node = stack[top]
+        taken = takens[node]
+        found = False
+        for ray in (RAYS if is_king else JUMPS)[bits[node]]:
+            if is_king:
+                # Dame : première pièce rencontrée sur le rayon, atterrissage juste derrière
+                for i, target in enumerate(ray):
+                    if (occupied >> target) & 1:
+                        break
+                else:
+                    continue
+                if i + 1 >= len(ray):
+                    continue
+                landing = ray[i + 1]
+            elif ray is None:
+                continue
+            else:
+                target, landing = ray
+            if not (opp >> target) & 1 or (taken >> target) & 1 or (occupied >> landing) & 1:
+                continue
+            found = True
+            if count >= size:
+                buffers.grow(size * 2)
+                size = buffers.size
+            new_taken = taken | (1 << target)
+            bits[count] = landing
+            takens[count] = new_taken
+            parents[count] = node
+            targets[count] = target
+            key = (new_taken << 6) | landing
+            if key not in visited:
+                visited.add(key)
+                stack[top] = count
+                top += 1
+            count += 1
+        if not found and node:
+            terminal.append(node)
+    return buffers, terminal
+
+
+def _landings_of(routes):
+    """
+    {atterrissage: bits pris} tiré des rafles complètes : chaque case atteinte,
+    étapes intermédiaires comprises, avec le plus long préfixe de rafle qui y mène.
+    """
+    landings = {}
+    for captured, stops in routes:
+        for i, landing in enumerate(stops):
+            if len(landings.get(landing, ())) <= i:
+                landings[landing] = captured[:i + 1]
+    return landings
+
+
+def capture_search(pos, origin):
+    """
+    Recherche de rafles en une seule passe, pour l'interface et l'IA.
+
+    Retourne (routes, landings) :
+      routes   : liste des rafles complètes sous forme (bits pris dans l'ordre,
+                 cases d'atterrissage successives) ; la dernière case est la destination ;
+      landings : {atterrissage: bits pris} pour toutes les cases atteintes,
+                 étapes intermédiaires comprises (voir `_landings_of`).
+    """
+    buffers, terminal = _capture_tree(pos, origin)
+    routes = [(_captured_of(buffers, node), _stops_of(buffers, node)) for node in terminal]
+    return routes, _landings_of(routes)
+
+
+def capture_landings(pos, origin):
+    """
+    Retourne {atterrissage: (bits pris dans l'ordre)} pour toutes les cases atteintes
+    pendant une rafle, y compris les étapes intermédiaires.
+    """
+    return capture_search(pos, origin)[1]
+
+
+def capture_paths(pos, origin):
+    """
+    Retourne la liste des rafles complètes d'une pièce, chacune sous forme de tuple
+    des bits pris dans l'ordre.
+    """
+    buffers, terminal = _capture_tree(pos, origin)
+    return [_captured_of(buffers, node) for node in terminal]
+
+
+def can_capture(pos, origin):
+    """Test rapide : la pièce peut-elle prendre au moins une pièce ?"""
+    opp, occupied = _capture_context(pos, origin)
+    if not pos.is_king(origin):
+        for jump in JUMPS[origin]:
+            if jump is not None and (opp >> jump[0]) & 1 and not (occupied >> jump[1]) & 1:
+                return True
+        return False
+    for ray in RAYS[origin]:
+        i = _first_piece(ray, occupied, True)
+        if 0 <= i < len(ray) - 1 and (opp >> ray[i]) & 1 and not (occupied >> ray[i + 1]) & 1:
+            return True
+    return False
+
+
+def is_threatened(pos, bit, color):
+    """
+    Vrai si la pièce de `color` en `bit` peut être prise par un pion adverse
+    voisin (case opposée libre).
+    """
+    opp = pos.pieces(opponent(color))
+    empty = pos.empty
+    neighbours = NEIGHBOURS[bit]
+    for k in range(4):
+        adj, behind = neighbours[k], neighbours[3 - k]
+        if adj is not None and behind is not None and (opp >> adj) & 1 and (empty >> behind) & 1:
+            return True
+    return False
+
+
+def capturers(pos, color):
+    """Masque des pièces de `color` qui ont au moins une prise."""
+    own = pos.pieces(color)
+    opp = pos.pieces(opponent(color))
+    empty = pos.empty
+    men = own & ~pos.kings
+    result = 0
+    # Pions : prise dans les 4 directions, calculée en parallèle sur tout le masque
+    for d in DIRECTIONS:
+        jumpers = shift(shift(empty, -d) & opp, -d) & men
+        result |= jumpers
+    for bit in iter_bits(own & pos.kings):
+        if can_capture(pos, bit):
+            result |= 1 << bit
+    return result
+
+
+def valid_moves(pos, origin):
+    """
+    Coups d'une pièce : ses prises (non filtrées) si elle peut prendre,
+    sinon ses déplacements simples. Retourne {destination: (bits pris)}.
+    """
+    if can_capture(pos, origin):
+        return capture_landings(pos, origin)
+    return {target: () for target in quiet_moves(pos, origin)}
+
+
+def quiet_move_is_legal(pos, color, origin, target):
+    """Vérifie qu'un déplacement simple est jouable (pièce de `color`, case libre atteignable)."""
+    return bool((pos.pieces(color) >> origin) & 1) and target in quiet_moves(pos, origin)
+
+
+def capture_routes(pos, color, takers=None):
+    """
+    Rafles complètes de `color` qui capturent le maximum de pièces, sous la
+    forme (origine, bits pris dans l'ordre, cases d'atterrissage successives).
+    Source unique des prises : `iter_captures` (recherche de l'IA),
+    `Board.get_capture_routes` et le cache des coups du tour (interface) en
+    dérivent, et produisent donc toujours le même ensemble de coups.
+    """
+    if takers is None:
+        takers = capturers(pos, color)
+    max_capture = 0
+    routes = []
+    for origin in iter_bits(takers):
+        buffers, terminal = _capture_tree(pos, origin)
+        takens = buffers.taken
+        for node in terminal:
+            count = takens[node].bit_count()
+            if count > max_capture:
+                max_capture = count
+                routes = []
+            if count == max_capture:
+                routes.append((origin, _captured_of(buffers, node), _stops_of(buffers, node)))
+    return routes
+
+
+def iter_captures(pos, color, takers=None):
+    """
+    Génère les prises de `color` qui capturent le maximum de pièces, sous la
+    forme (origine, destination, bits pris) : une par rafle de `capture_routes`
+    (deux rafles vers la même destination sont deux coups distincts).
+    """
+    for origin, captured, stops in capture_routes(pos, color, takers):
+        yield origin, stops[-1], captured
+
+
+def iter_quiet_moves(pos, color):
+    """
+    Génère paresseusement les déplacements simples de `color`, pièce par pièce.
+    """
+    empty = VALID_MASK & ~(pos.white | pos.black)
+    kings = pos.kings
+    forward = FORWARD_NEIGHBOURS[color]
+    for origin in iter_bits(pos.pieces(color)):
+        if (kings >> origin) & 1:
+            for target in quiet_moves(pos, origin):
+                yield origin, target, ()
+        else:
+            for target in forward[origin]:
+                if (empty >> target) & 1:
+                    yield origin, target, ()
+
+
+def iter_moves(pos, color):
+    """
+    Génération par étapes : un test rapide détermine d'abord si une prise existe ;
+    si oui, seules les prises maximales sont produites, sinon les déplacements
+    simples sont produits au fur et à mesure. Le consommateur peut s'arrêter à
+    tout moment (coupure alpha-beta) sans payer le reste de la génération.
+    """
+    takers = capturers(pos, color)
+    if takers:
+        return iter_captures(pos, color, takers)
+    return iter_quiet_moves(pos, color)
+
+
+def generate_moves(pos, color):
+    """
+    Retourne {origine: {destination: (bits pris)}} pour `color`, en appliquant
+    la règle de la prise maximale obligatoire. Cette forme ne garde qu'une
+    rafle par destination : quand deux rafles aboutissent sur la même case,
+    `iter_moves` ou `capture_routes` donnent l'ensemble complet des coups.
+    """
+    all_moves = {}
+    for origin, dest, captured in iter_moves(pos, color):
+        if origin not in all_moves:
+            all_moves[origin] = {}
+        all_moves[origin][dest] = captured
+    return all_moves
+
+
+# Notation FEN du format PDN, par exemple « W:W31,32,K45:B1,2,3 » : camp au trait,
+# puis cases des pièces blanches et noires (K = dame). Les cases foncées sont
+# numérotées de 1 à 50 ligne par ligne depuis le haut du plateau (côté noir).
+FEN_COLORS = {'W': 'blanc', 'B': 'noir'}
+
+
+def square_number(bit):
+    """Numéro officiel (1 à 50) de la case d'un bit."""
+    row, col = BIT_TO_SQUARE[bit]
+    return row * (BOARD_SIZE // 2) + col // 2 + 1
+
+
+def bit_from_number(number):
+    row, index = divmod(number - 1, BOARD_SIZE // 2)
+    return SQUARE_TO_BIT[(row, 2 * index + (1 - row % 2))]
+
+
+def position_from_fen(fen):
+    """Retourne (Position, camp au trait) à partir d'une chaîne FEN."""
+    fields = fen.strip().rstrip('.').split(':')
+    if len(fields) < 1 or fields[0].upper() not in FEN_COLORS:
+        raise ValueError(f"FEN invalide : {fen!r}")
+    masks = {'blanc': 0, 'noir': 0}
+    kings = 0
+    for field in fields[1:]:
+        if not field:
+            continue
+        color = FEN_COLORS.get(field[0].upper())
+        if color is None:
+            raise ValueError(f"FEN invalide : {fen!r}")
+        for token in field[1:].split(','):
+            token = token.strip()
+            if not token:
+                continue
+            king = token[0].upper() == 'K'
+            number = int(token[1:] if king else token)
+            if not 1 <= number <= 50:
+                raise ValueError(f"Case hors plateau dans la FEN : {number}")
+            bit = bit_from_number(number)
+            masks[color] |= 1 << bit
+            if king:
+                kings |= 1 << bit
+    return Position(masks['blanc'], masks['noir'], kings), FEN_COLORS[fields[0].upper()]
+
+
+def position_to_fen(pos, color):
+    fields = ['W' if color == 'blanc' else 'B']
+    for letter, mask in (('W', pos.white), ('B', pos.black)):
+        squares = sorted((square_number(bit), bool((pos.kings >> bit) & 1)) for bit in iter_bits(mask))
+        fields.append(letter + ','.join(('K' if king else '') + str(number) for number, king in squares))
+    return ':'.join(fields)
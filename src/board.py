@@ -1,15 +1,29 @@
 from src.constants import *
 from src.piece import Piece
+from src import bitboard
+from src.bitboard import Position, square_to_bit, bit_to_square
+from src.evaluation import piece_score
 
 class Board:
     """
     Classe représentant le plateau de jeu.
+
+    Les objets `Piece` servent à l'affichage et aux animations ; la génération
+    des coups est déléguée au moteur bitboard (`self.position`), tenu à jour
+    par `move`, `remove`, `place` et `set_king`.
+
+    Ces mêmes méthodes tiennent à jour l'ensemble des pièces de chaque camp
+    (`pieces`), les compteurs de pions et de dames (`men`, `kings`) et le
+    score des tables pièce-case (`score`, point de vue des noirs), lus en O(1)
+    par l'évaluation, la fin de partie et les statistiques.
     """
     def __init__(self):
         """
         Initialise le plateau de jeu.
         """
         self.board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        self.position = Position()
+        self._reset_counters()
         self.selected = None
         self.valid_moves = {}
         self.create_board()
@@ -22,18 +36,49 @@ class Board:
                         self.board[row][col] = Piece(row, col, 'noir')
                     elif row > 5:
                         self.board[row][col] = Piece(row, col, 'blanc')
+                    if self.board[row][col]:
+                        self._count(self.board[row][col], 1)
+        self.position = Position.initial()
+
+    def _reset_counters(self):
+        self.pieces = {'blanc': set(), 'noir': set()}
+        self.men = {'blanc': 0, 'noir': 0}
+        self.kings = {'blanc': 0, 'noir': 0}
+        self.score = 0
+
+    def _count(self, piece, delta):
+        """Ajoute (delta=1) ou retire (delta=-1) une pièce des ensembles et compteurs."""
+        if delta > 0:
+            self.pieces[piece.color].add(piece)
+        else:
+            self.pieces[piece.color].discard(piece)
+        if piece.king:
+            self.kings[piece.color] += delta
+        else:
+            self.men[piece.color] += delta
+        self.score += delta * piece_score(piece)
+
+    def count(self, color):
+        """Nombre de pièces (pions et dames) de `color`."""
+        return self.men[color] + self.kings[color]
 
     def draw(self, screen, theme, square_size):
         import pygame
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                color = theme["light"] if (row + col) % 2 == 0 else theme["dark"]
-                pygame.draw.rect(screen, color, (col*square_size, row*square_size, square_size, square_size))
+        from src.render_cache import board_background, piece_atlas
+        # Damier et sprites des pièces pré-rendus une fois par (thème, taille de case)
+        screen.blit(board_background(theme, square_size), (0, 0))
+        atlas = piece_atlas(theme, square_size)
+        half = square_size // 2
+        sprites = []
         for row in range(BOARD_SIZE):
             for col in range(BOARD_SIZE):
                 piece = self.board[row][col]
                 if piece:
-                    piece.draw(screen, theme, square_size)
+                    if piece.anim_x is None or piece.anim_y is None:
+                        sprites.append(atlas.piece(piece.color, piece.king, col * square_size + half, row * square_size + half))
+                    else:
+                        sprites.append(atlas.piece(piece.color, piece.king, piece.anim_x, piece.anim_y, moving=True))
+        screen.blits(sprites, doreturn=False)
         if self.selected:
             pygame.draw.rect(screen, GREEN, (self.selected[1]*square_size, self.selected[0]*square_size, square_size, square_size), 3)
         for move in self.valid_moves:
@@ -45,13 +90,136 @@ class Board:
     def move(self, piece, row, col):
         self.board[piece.row][piece.col] = None
         self.board[row][col] = piece
+        self.position.clear(square_to_bit(piece.row, piece.col))
+        self.score -= piece_score(piece)
         piece.row, piece.col = row, col
-        if (piece.color == 'blanc' and row == 0) or (piece.color == 'noir' and row == BOARD_SIZE-1):
+        if not piece.king and ((piece.color == 'blanc' and row == 0) or (piece.color == 'noir' and row == BOARD_SIZE-1)):
             piece.make_king()
+            self.men[piece.color] -= 1
+            self.kings[piece.color] += 1
+        self.score += piece_score(piece)
+        self.position.put(square_to_bit(row, col), piece.color, piece.king)
 
     def remove(self, pieces):
         for p in pieces:
             self.board[p.row][p.col] = None
+            self.position.clear(square_to_bit(p.row, p.col))
+            self._count(p, -1)
+
+    def place(self, pieces):
+        """
+        Remet sur le plateau des pièces retirées par `remove` (à leur position row/col).
+        """
+        for p in pieces:
+            self.board[p.row][p.col] = p
+            self.position.put(square_to_bit(p.row, p.col), p.color, p.king)
+            self._count(p, 1)
+
+    def set_king(self, piece, king=True):
+        """
+        Change le statut de dame d'une pièce en gardant le bitboard synchronisé.
+        """
+        self._count(piece, -1)
+        piece.king = king
+        self._count(piece, 1)
+        self.position.put(square_to_bit(piece.row, piece.col), piece.color, king)
+
+    @classmethod
+    def from_position(cls, position):
+        """
+        Construit un plateau indépendant (nouvelles pièces) à partir d'une `Position`.
+        Sert à donner à la recherche en arrière-plan sa propre copie du jeu.
+        """
+        board = cls.__new__(cls)
+        board.board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        board.position = position.copy()
+        board._reset_counters()
+        board.selected = None
+        board.valid_moves = {}
+        for bit in bitboard.iter_bits(position.occupied):
+            row, col = bit_to_square(bit)
+            piece = Piece(row, col, position.color_at(bit))
+            piece.king = position.is_king(bit)
+            board.board[row][col] = piece
+            board._count(piece, 1)
+        return board
+
+    def has_captures(self, color):
+        return bool(bitboard.capturers(self.position, color))
+
+    def make_move(self, move):
+        """
+        Joue un coup (start, end, captured) où captured est la liste ordonnée des
+        positions prises. Retourne l'enregistrement à passer à `unmake_move`.
+        """
+        start, end, captured = move
+        piece = self.board[start[0]][start[1]]
+        was_king = piece.king
+        taken = [self.board[r][c] for r, c in captured]
+        self.move(piece, end[0], end[1])
+        self.remove(taken)
+        return (piece, start, was_king, taken)
+
+    def unmake_move(self, undo):
+        """
+        Annule un coup joué par `make_move` : la pièce revient à sa case de départ
+        avec son statut de dame d'origine et les pièces prises sont replacées.
+        """
+        piece, start, was_king, taken = undo
+        self.board[piece.row][piece.col] = None
+        self.position.clear(square_to_bit(piece.row, piece.col))
+        self.score -= piece_score(piece)
+        piece.row, piece.col = start
+        if piece.king != was_king:
+            # Annuler la promotion
+            self.kings[piece.color] -= 1
+            self.men[piece.color] += 1
+            piece.king = was_king
+        self.score += piece_score(piece)
+        self.board[start[0]][start[1]] = piece
+        self.position.put(square_to_bit(start[0], start[1]), piece.color, was_king)
+        self.place(taken)
+
+    def position_key(self, color):
+        """
+        Clé de Zobrist de la position avec `color` au trait (mise à jour incrémentalement).
+        """
+        return self.position.key(color)
+
+    def iter_moves(self, color):
+        """
+        Parcourt paresseusement les coups légaux de `color` sous la forme
+        (start, end, captured) acceptée par `make_move` : prises maximales s'il
+        y en a, sinon déplacements simples générés au fur et à mesure.
+        """
+        return self._convert_moves(bitboard.iter_moves(self.position, color))
+
+    def iter_captures(self, color, takers=None):
+        """
+        Prises maximales de `color`. `takers` : masque des pièces qui peuvent
+        prendre (`bitboard.capturers`), s'il est déjà calculé.
+        """
+        return self._convert_moves(bitboard.iter_captures(self.position, color, takers))
+
+    def iter_quiet_moves(self, color):
+        """
+        Déplacements simples de `color`, générés au fur et à mesure. Ne tient pas
+        compte des prises obligatoires (à tester avec `has_captures`).
+        """
+        return self._convert_moves(bitboard.iter_quiet_moves(self.position, color))
+
+    def is_legal_quiet_move(self, color, move):
+        """
+        Vérifie sans générer tous les coups qu'un déplacement simple est jouable.
+        Ne tient pas compte des prises obligatoires (à tester avec `has_captures`).
+        """
+        start, end = square_to_bit(*move[0]), square_to_bit(*move[1])
+        return start is not None and end is not None and bitboard.quiet_move_is_legal(self.position, color, start, end)
+
+    @staticmethod
+    def _convert_moves(moves):
+        for origin, dest, captured in moves:
+            yield bit_to_square(origin), bit_to_square(dest), [bit_to_square(b) for b in captured]
 
     def get_square_from_mouse(self, mouse_x, mouse_y, square_size):
         row = mouse_y // square_size
@@ -62,132 +230,22 @@ class Board:
 
     def get_valid_moves(self, piece):
         # Prise maximale obligatoire (filtrée dans get_all_moves)
-        all_captures = self._get_all_captures(piece)
-        if all_captures:
-            return all_captures
-        # Déplacement simple
-        moves = {}
-        if not piece.king:
-            directions = [(-1, -1), (-1, 1)] if piece.color == 'blanc' else [(1, -1), (1, 1)]
-            for dr, dc in directions:
-                r, c = piece.row + dr, piece.col + dc
-                if 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE and self.board[r][c] is None:
-                    moves[(r, c)] = []
-        else:
-            # Dame volante - UNIQUEMENT en diagonale
-            for dr, dc in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                r, c = piece.row + dr, piece.col + dc
-                # Limiter à 3 cases maximum pour plus de stabilité
-                steps = 0
-                max_steps = 3  # Limiter la portée du roi pour plus de stabilité
-                while 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE and self.board[r][c] is None and steps < max_steps:
-                    moves[(r, c)] = []
-                    # S'assurer que le déplacement continue strictement en diagonale
-                    r += dr
-                    c += dc
-                    steps += 1
-        return moves
+        moves = bitboard.valid_moves(self.position, square_to_bit(piece.row, piece.col))
+        return {bit_to_square(dest): self._pieces_at(captured) for dest, captured in moves.items()}
 
     def get_all_moves(self, color):
+        # Une rafle par destination (voir bitboard.generate_moves) : iter_moves les donne toutes
         all_moves = {}
-        max_capture = 0
-        # 1. Collecte tous les coups et trouve le max de captures
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                piece = self.get_piece(row, col)
-                if piece and piece.color == color:
-                    moves = self.get_valid_moves(piece)
-                    for dest, captured in moves.items():
-                        if len(captured) > max_capture:
-                            max_capture = len(captured)
-        # 2. Ne garde que les coups qui capturent le max
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                piece = self.get_piece(row, col)
-                if piece and piece.color == color:
-                    moves = self.get_valid_moves(piece)
-                    filtered = {}
-                    for dest, captured in moves.items():
-                        if max_capture > 0:
-                            if len(captured) == max_capture:
-                                filtered[dest] = captured
-                        else:
-                            if len(captured) == 0:
-                                filtered[dest] = []
-                    if filtered:
-                        all_moves[(row, col)] = filtered
+        for origin, moves in bitboard.generate_moves(self.position, color).items():
+            all_moves[bit_to_square(origin)] = {
+                bit_to_square(dest): self._pieces_at(captured) for dest, captured in moves.items()
+            }
         return all_moves
 
     def _get_all_captures(self, piece):
         # Capture multiple, prise arrière autorisée pour pion, dame volante
-        captures = {}
-        stack = [((piece.row, piece.col), [], set(), piece.king)]
-        visited_paths = set()
-        
-        while stack:
-            (row, col), captured, already, is_king = stack.pop()
-            
-            # Vérifier strictement les quatre directions diagonales
-            for dr, dc in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                # Pour les rois, on peut aller plus loin mais toujours en diagonale
-                curr_r, curr_c = row, col
-                step_count = 0
-                max_steps = BOARD_SIZE if is_king else 1
-                
-                while step_count < max_steps:
-                    # Calculer la position suivante en diagonale
-                    r = curr_r + dr
-                    c = curr_c + dc
-                    
-                    # Sortie du plateau
-                    if not (0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE):
-                        break
-                    
-                    target = self.board[r][c]
-                    # Case vide
-                    if target is None:
-                        if not is_king:
-                            break
-                        # Pour un roi, continuer à avancer en diagonale
-                        curr_r, curr_c = r, c
-                        step_count += 1
-                        continue
-                    
-                    # On a trouvé une pièce adverse
-                    if target.color != piece.color and (r, c) not in already:
-                        # Vérifier qu'on peut atterrir après la pièce (toujours en diagonale)
-                        r2 = r + dr
-                        c2 = c + dc
-                        
-                        if 0 <= r2 < BOARD_SIZE and 0 <= c2 < BOARD_SIZE and self.board[r2][c2] is None:
-                            # Pour un pion : on peut sauter que d'une case
-                            if not is_king:
-                                new_captured = captured + [target]
-                                path = tuple(sorted((p.row, p.col) for p in new_captured))
-                                if ((r2, c2), path) not in visited_paths:
-                                    visited_paths.add(((r2, c2), path))
-                                    stack.append(((r2, c2), new_captured, already | {(r, c)}, is_king))
-                                captures[(r2, c2)] = new_captured
-                            else:
-                                # Pour une dame : on peut atterrir à plusieurs cases après en diagonale
-                                landing_r, landing_c = r2, c2
-                                
-                                # Vérifier toutes les cases d'atterrissage possibles après le saut
-                                # Limiter à une seule position après la capture pour plus de stabilité
-                                if 0 <= landing_r < BOARD_SIZE and 0 <= landing_c < BOARD_SIZE and self.board[landing_r][landing_c] is None:
-                                    new_captured = captured + [target]
-                                    path = tuple(sorted((p.row, p.col) for p in new_captured))
-                                    
-                                    if ((landing_r, landing_c), path) not in visited_paths:
-                                        visited_paths.add(((landing_r, landing_c), path))
-                                        stack.append(((landing_r, landing_c), new_captured, already | {(r, c)}, is_king))
-                                    
-                                    captures[(landing_r, landing_c)] = new_captured
-                    
-                    # Si on a trouvé une pièce (adverse ou non), on ne peut pas aller plus loin
-                    break
-                    
-        return captures
+        captures = bitboard.capture_landings(self.position, square_to_bit(piece.row, piece.col))
+        return {bit_to_square(dest): self._pieces_at(captured) for dest, captured in captures.items()}
 
     def get_max_capture_moves(self, pieces):
         """
@@ -195,14 +253,13 @@ class Board:
         mais uniquement pour les mouvements qui capturent le maximum de pions.
         """
         max_captures = 0
-        moves_by_piece = {}
-        for piece in pieces:
-            moves = self.get_valid_moves(piece)
-            for dest, captured in moves.items():
+        all_moves = {piece: self.get_valid_moves(piece) for piece in pieces}
+        for moves in all_moves.values():
+            for captured in moves.values():
                 if len(captured) > max_captures:
                     max_captures = len(captured)
-        for piece in pieces:
-            moves = self.get_valid_moves(piece)
+        moves_by_piece = {}
+        for piece, moves in all_moves.items():
             filtered = {}
             for dest, captured in moves.items():
                 if len(captured) == max_captures and max_captures > 0:
@@ -216,90 +273,45 @@ class Board:
         Retourne un dict {(row, col): [chemin1, chemin2, ...]} où chaque chemin est une liste de positions (captures enchaînées).
         """
         captures = {}
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                piece = self.get_piece(row, col)
-                if piece and piece.color == color:
-                    all_paths = self._get_capture_paths(piece)
-                    if all_paths:
-                        captures[(row, col)] = all_paths
+        for origin in bitboard.iter_bits(bitboard.capturers(self.position, color)):
+            paths = bitboard.capture_paths(self.position, origin)
+            if paths:
+                captures[bit_to_square(origin)] = [[bit_to_square(b) for b in path] for path in paths]
         return captures
 
+    def get_capture_routes(self, color):
+        """
+        Retourne ({(row, col): [(destination, chemin, étapes), ...]}, nombre maximal de prises)
+        en ne gardant que les rafles qui prennent le maximum de pièces. `chemin` est
+        la liste des positions prises et `étapes` celle des cases d'atterrissage
+        successives (la dernière est la destination), calculées en une seule passe.
+        """
+        routes_by_piece = {}
+        max_count = 0
+        for origin, captured, stops in bitboard.capture_routes(self.position, color):
+            max_count = len(captured)
+            start = bit_to_square(origin)
+            if start not in routes_by_piece:
+                routes_by_piece[start] = []
+            routes_by_piece[start].append(
+                (bit_to_square(stops[-1]), [bit_to_square(b) for b in captured], [bit_to_square(b) for b in stops])
+            )
+        return routes_by_piece, max_count
+
     def _get_capture_paths(self, piece):
         """
         Retourne tous les chemins de capture possibles pour une pièce (liste de listes de positions finales, chaque chemin = [(r1,c1), (r2,c2), ...]).
         """
-        paths = []
-        stack = [((piece.row, piece.col), [], set(), piece.king)]
-        visited = set()
-        
-        while stack:
-            (row, col), captured, already, is_king = stack.pop()
-            found = False
-            
-            # Vérifier strictement les quatre directions diagonales
-            for dr, dc in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                # Pour les rois, on peut aller plus loin mais toujours en diagonale
-                curr_r, curr_c = row, col
-                step_count = 0
-                max_steps = BOARD_SIZE if is_king else 1
-                
-                while step_count < max_steps:
-                    # Calculer la position suivante en diagonale
-                    r = curr_r + dr
-                    c = curr_c + dc
-                    
-                    # Sortie du plateau
-                    if not (0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE):
-                        break
-                    
-                    target = self.board[r][c]
-                    # Case vide
-                    if target is None:
-                        if not is_king:
-                            break
-                        # Pour un roi, continuer à avancer en diagonale
-                        curr_r, curr_c = r, c
-                        step_count += 1
-                        continue
-                    
-                    # On a trouvé une pièce adverse
-                    if target.color != piece.color and (r, c) not in already:
-                        # Vérifier qu'on peut atterrir après la pièce (toujours en diagonale)
-                        r2 = r + dr
-                        c2 = c + dc
-                        
-                        if 0 <= r2 < BOARD_SIZE and 0 <= c2 < BOARD_SIZE and self.board[r2][c2] is None:
-                            # Pour un pion : on peut sauter que d'une case
-                            if not is_king:
-                                new_captured = captured + [(r, c)]
-                                path = tuple(sorted(new_captured))
-                                if ((r2, c2), path) not in visited:
-                                    visited.add(((r2, c2), path))
-                                    stack.append(((r2, c2), new_captured, already | {(r, c)}, is_king))
-                                found = True
-                            else:
-                                # Pour une dame : on peut atterrir à plusieurs cases après en diagonale
-                                landing_r, landing_c = r2, c2
-                                # Limiter à une seule position après la capture pour plus de stabilité
-                                if 0 <= landing_r < BOARD_SIZE and 0 <= landing_c < BOARD_SIZE and self.board[landing_r][landing_c] is None:
-                                    new_captured = captured + [(r, c)]
-                                    path = tuple(sorted(new_captured))
-                                    
-                                    if ((landing_r, landing_c), path) not in visited:
-                                        visited.add(((landing_r, landing_c), path))
-                                        stack.append(((landing_r, landing_c), new_captured, already | {(r, c)}, is_king))
-                                    
-                                    found = True
-                    
-                    # Si on a trouvé une pièce (adverse ou non), on ne peut pas aller plus loin
-                    break
-            
-            if not found and captured:
-                # Fin de chaîne de capture
-                paths.append(captured)
-        
-        return paths
+        paths = bitboard.capture_paths(self.position, square_to_bit(piece.row, piece.col))
+        return [[bit_to_square(b) for b in path] for path in paths]
+
+    def _pieces_at(self, bits):
+        board = self.board
+        pieces = []
+        for bit in bits:
+            row, col = bit_to_square(bit)
+            pieces.append(board[row][col])
+        return pieces
 
     @staticmethod
     def get_max_capture_count(captures_dict):
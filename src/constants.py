@@ -7,6 +7,7 @@ BOARD_PIXEL_SIZE = BOARD_SIZE * SQUARE_SIZE
 PANEL_WIDTH = 260
 WINDOW_SIZE = (900, 900)
 FPS = 60
+IDLE_TIMEOUT_MS = 500  # Attente maximale d'un événement quand rien n'est animé
 
 # Couleurs de base
 BLACK = (0, 0, 0)
@@ -82,9 +83,23 @@ THEMES = [
     }
 ]
 
+# Rendu
+RENDER_CACHE_SIZE = 8  # Surfaces pré-rendues gardées par cache (thème, taille de case)
+TEXT_CACHE_SIZE = 256  # Textes rendus gardés en mémoire (police, texte, couleur)
+BACK_BUTTON_SIZE = (180, 50)  # Bouton retour de fin de partie (hors pulsation)
+
 # Points
 CAPTURE_POINTS = 1
 KING_POINTS = 2
 
 # Divers
-HISTORY_LENGTH = 10 
\ No newline at end of file
+HISTORY_LENGTH = 10 
+# IA
+TT_MEMORY_MB = 16  # Mémoire maximale de la table de transposition
+AI_TIME_BUDGET = 1.0  # Temps de réflexion par coup (secondes) au niveau difficile
+AI_NODE_BUDGET = None  # Nombre maximal de nœuds par coup (None = illimité)
+AI_MAX_DEPTH = 32  # Profondeur maximale de l'approfondissement itératif
+AI_PARALLEL_WORKERS = None  # Processus de recherche parallèle (None = un par cœur, 1 = désactivé)
+AI_OPENING_BOOK = True  # Coups d'ouverture du niveau difficile lus dans src/opening_book.bin
+AI_TABLEBASE = True  # Finales à peu de pièces résolues par src/tablebase.bin (voir src.tablebase)
+AI_EVAL_DEBUG = False  # Vérifie l'évaluation incrémentale par un recalcul complet (lent)
@@ -0,0 +1,135 @@
+from src.bitboard import opponent
+from src.board import Board
+from src.constants import CAPTURE_POINTS
+from src.move_cache import MoveCache
+
+
+class IllegalMoveError(ValueError):
+    """
+    Levée par `GameController.play` pour un coup qui n'est pas légal dans la
+    position (prise obligatoire ignorée, destination invalide, partie terminée).
+    """
+
+
+class MoveRecord:
+    """
+    Coup joué, tel qu'émis avec l'événement « move » :
+
+    - `piece` : la pièce déplacée (déjà à sa destination) ;
+    - `start`, `end` : cases de départ et d'arrivée ;
+    - `captured` : pièces prises, dans l'ordre (déjà retirées du plateau) ;
+    - `stops` : cases d'atterrissage successives (la dernière est `end`) ;
+    - `promoted` : vrai si le coup a promu la pièce en dame.
+    """
+    __slots__ = ('color', 'piece', 'start', 'end', 'captured', 'stops', 'promoted')
+
+    def __init__(self, color, piece, start, end, captured, stops, promoted):
+        self.color = color
+        self.piece = piece
+        self.start = start
+        self.end = end
+        self.captured = captured
+        self.stops = stops
+        self.promoted = promoted
+
+
+class GameController:
+    """
+    Règles et déroulement d'une partie, sans affichage ni pygame : les coups sont
+    vérifiés et appliqués immédiatement par `play`, puis signalés aux abonnés
+    (`subscribe`). Les vues pygame (`Game`, `GameVsAI`) s'abonnent pour animer
+    et afficher ; l'analyse, les tournois et les scripts pilotent directement
+    le contrôleur.
+
+    Événements :
+    - « move » (MoveRecord) après chaque coup appliqué ;
+    - « game_over » (camp gagnant) quand le camp au trait n'a plus de coup ;
+    - « position » (nouveau plateau) après `set_position`.
+    """
+    def __init__(self, board=None, current_player='blanc'):
+        self.listeners = {}
+        self._reset(board if board is not None else Board(), current_player)
+
+    def _reset(self, board, color):
+        self.board = board
+        self.move_cache = MoveCache(board)  # Coups légaux du tour, calculés une fois
+        self.current_player = color
+        self.history = []
+        self.scores = {'noir': 0, 'blanc': 0}
+        # kings : dames sur le plateau (compteur du plateau) ; promotions : pions promus
+        self.stats = {color: {'captures': 0, 'kings': 0, 'promotions': 0} for color in ('noir', 'blanc')}
+        self.winner = None
+        self.game_over = False
+
+    def set_position(self, position, color):
+        """Repart d'une `Position` quelconque avec `color` au trait."""
+        self._reset(Board.from_position(position), color)
+        self.emit('position', self.board)
+        self._check_game_over()
+
+    def subscribe(self, event, callback):
+        self.listeners.setdefault(event, []).append(callback)
+
+    def emit(self, event, *args):
+        for callback in self.listeners.get(event, ()):
+            callback(*args)
+
+    def legal_moves(self, color=None):
+        """Coups légaux (`TurnMoves`) de `color`, par défaut du camp au trait."""
+        return self.move_cache.get(color or self.current_player)
+
+    def find_move(self, start, end, path=None):
+        """
+        Retourne (positions prises, étapes) du coup légal start -> end du camp
+        au trait, ou None. Quand plusieurs rafles maximales mènent à la même
+        destination, `path` choisit laquelle (sinon la première).
+        """
+        turn = self.legal_moves()
+        if turn.max_captures > 0:
+            for dest, captured, stops in turn.routes.get(start, ()):
+                if dest == end and (path is None or list(path) == captured):
+                    return captured, stops
+            return None
+        if end in turn.moves.get(start, ()):
+            return [], [end]
+        return None
+
+    def play(self, start, end, path=None):
+        """
+        Joue le coup start -> end du camp au trait et retourne son `MoveRecord`.
+        Lève IllegalMoveError si le coup n'est pas légal.
+        """
+        if self.game_over:
+            raise IllegalMoveError("la partie est terminée")
+        move = self.find_move(start, end, path)
+        if move is None:
+            raise IllegalMoveError(f"coup illégal pour {self.current_player} : {start} -> {end}")
+        path, stops = move
+        color = self.current_player
+        board = self.board
+        piece = board.get_piece(start[0], start[1])
+        was_king = piece.king
+        captured = [board.get_piece(r, c) for r, c in path]
+        board.make_move((start, end, path))
+        self.move_cache.invalidate()
+
+        promoted = piece.king and not was_king
+        self.stats[color]['captures'] += len(captured)
+        self.scores[color] += len(captured) * CAPTURE_POINTS
+        self.stats[color]['kings'] = board.kings[color]
+        if promoted:
+            self.stats[color]['promotions'] += 1
+        record = MoveRecord(color, piece, start, end, captured, stops, promoted)
+        self.history.append(record)
+        self.current_player = opponent(color)
+        self.emit('move', record)
+        self._check_game_over()
+        return record
+
+    def _check_game_over(self):
+        # Camp au trait sans pièce ou bloqué : il perd
+        color = self.current_player
+        if not self.legal_moves(color).moves:
+            self.winner = opponent(color)
+            self.game_over = True
+            self.emit('game_over', self.winner)
@@ -1,5 +1,6 @@
 import pygame
 from src.constants import *
+from src.render_cache import get_font, render_text
 
 class DifficultyMenu:
     def __init__(self):
@@ -17,8 +18,8 @@ class DifficultyMenu:
         win_w, win_h = screen.get_size()
         center_x = win_w // 2
         screen.fill((30, 30, 30))
-        title_font = pygame.font.SysFont(None, int(win_h * 0.08), bold=True)
-        title = title_font.render("Choix de la difficulté", True, WHITE)
+        title_font = get_font(None, int(win_h * 0.08), bold=True)
+        title = render_text(title_font, "Choix de la difficulté", WHITE)
         screen.blit(title, (center_x - title.get_width() // 2, int(win_h * 0.10)))
         btn_w, btn_h = int(win_w * 0.35), int(win_h * 0.09)
         spacing = int(win_h * 0.04)
@@ -32,7 +33,7 @@ class DifficultyMenu:
             border = (YELLOW if mouse_over else (180, 180, 180))
             pygame.draw.rect(screen, color, rect, border_radius=btn_h // 2)
             pygame.draw.rect(screen, border, rect, 3, border_radius=btn_h // 2)
-            txt = font.render(label, True, (30, 30, 30))
+            txt = render_text(font, label, (30, 30, 30))
             screen.blit(txt, (rect.x + rect.width // 2 - txt.get_width() // 2, rect.y + rect.height // 2 - txt.get_height() // 2))
 
     def handle_event(self, event):
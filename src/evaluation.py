@@ -0,0 +1,86 @@
+from src.constants import BOARD_SIZE
+
+# Valeurs matérielles de base
+MAN_VALUE = 10
+KING_VALUE = 15
+
+# Bonus positionnels (mêmes unités que le matériel)
+ADVANCE_BONUS = 1      # pion à moins de trois rangées de la promotion
+CENTRE_BONUS = 1       # pion sur les colonnes centrales des rangées centrales
+BACK_RANK_BONUS = 1    # pion resté sur sa rangée de départ (garde contre la promotion adverse)
+KING_CENTRE_BONUS = 2  # dame au centre ou sur la grande diagonale
+EDGE_PENALTY = 1       # dame sur une colonne du bord (une seule diagonale contrôlée)
+
+
+def _man_bonus(row, col):
+    """Bonus d'un pion noir (qui avance vers les rangées croissantes)."""
+    bonus = 0
+    if row >= BOARD_SIZE - 3:
+        bonus += ADVANCE_BONUS
+    if 3 <= row <= 6 and 3 <= col <= 6:
+        bonus += CENTRE_BONUS
+    if row == 0:
+        bonus += BACK_RANK_BONUS
+    return bonus
+
+
+def _king_bonus(row, col):
+    bonus = 0
+    if (2 <= row <= 7 and 2 <= col <= 7) or row + col == BOARD_SIZE - 1:
+        bonus += KING_CENTRE_BONUS
+    if col in (0, BOARD_SIZE - 1):
+        bonus -= EDGE_PENALTY
+    return bonus
+
+
+def _build_tables():
+    """
+    Tables pièce-case signées, du point de vue des noirs : les pièces noires
+    comptent en positif, les blanches en négatif. Les blancs avancent vers les
+    rangées décroissantes : leur table est celle des noirs tournée d'un demi-tour.
+    """
+    tables = {}
+    for king in (False, True):
+        base = KING_VALUE if king else MAN_VALUE
+        bonus = _king_bonus if king else _man_bonus
+        tables[('noir', king)] = [
+            [base + bonus(row, col) for col in range(BOARD_SIZE)] for row in range(BOARD_SIZE)
+        ]
+        tables[('blanc', king)] = [
+            [-(base + bonus(BOARD_SIZE - 1 - row, BOARD_SIZE - 1 - col)) for col in range(BOARD_SIZE)]
+            for row in range(BOARD_SIZE)
+        ]
+    return tables
+
+
+PIECE_SQUARE = _build_tables()
+
+_DARK_VALUES = [
+    abs(PIECE_SQUARE[('noir', king)][row][col])
+    for king in (False, True)
+    for row in range(BOARD_SIZE)
+    for col in range(BOARD_SIZE)
+    if (row + col) % 2 == 1
+]
+# Valeur maximale d'une pièce et écart maximal de valeur d'une pièce qui se déplace
+# (promotion comprise) : bornes utilisées par le delta pruning de la quiescence
+MAX_PIECE_VALUE = max(_DARK_VALUES)
+MAX_SWING = max(_DARK_VALUES) - min(_DARK_VALUES)
+
+
+def piece_score(piece):
+    """Contribution signée d'une pièce à l'évaluation (positive pour les noirs)."""
+    return PIECE_SQUARE[(piece.color, piece.king)][piece.row][piece.col]
+
+
+def evaluate(board):
+    """
+    Recalcul complet de l'évaluation par parcours des pièces. Le plateau tient
+    ce score à jour incrémentalement (`Board.score`) ; ce recalcul sert de
+    vérification en mode débogage (voir AI_EVAL_DEBUG).
+    """
+    score = 0
+    for color in ('blanc', 'noir'):
+        for piece in board.pieces[color]:
+            score += piece_score(piece)
+    return score
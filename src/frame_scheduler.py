@@ -0,0 +1,42 @@
+import pygame
+
+from src.constants import FPS, IDLE_TIMEOUT_MS
+
+
+class FrameScheduler:
+    """
+    Cadence de la boucle principale. Tant que l'affichage change de lui-même
+    (pièce animée, bouton pulsant, tour de l'IA), les images s'enchaînent à
+    `fps` ; sinon la boucle dort dans `pygame.event.wait` jusqu'au prochain
+    événement (souris, clavier, fenêtre), au plus `idle_timeout` ms : une
+    partie ou un menu immobile n'occupe plus le processeur.
+
+    `mode` (ACTIVE ou IDLE) et `frames` (images par mode) servent au
+    diagnostic.
+    """
+    ACTIVE = 'active'
+    IDLE = 'idle'
+
+    def __init__(self, fps=FPS, idle_timeout=IDLE_TIMEOUT_MS, clock=None):
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self.clock = clock if clock is not None else pygame.time.Clock()
+        self.mode = self.ACTIVE
+        self.frames = {self.ACTIVE: 0, self.IDLE: 0}
+
+    def next_frame(self, busy):
+        """
+        Attend l'image suivante et retourne (dt en secondes, événements reçus).
+        `busy` : l'affichage doit être mis à jour même sans événement.
+        """
+        self.mode = self.ACTIVE if busy else self.IDLE
+        self.frames[self.mode] += 1
+        if busy:
+            return self.clock.tick(self.fps) / 1000.0, pygame.event.get()
+        event = pygame.event.wait(self.idle_timeout)
+        events = pygame.event.get()
+        if event.type != pygame.NOEVENT:
+            events.insert(0, event)
+        # Le temps passé à attendre n'a rien à animer : une animation lancée par
+        # cet événement part de son début au lieu de sauter à sa fin
+        return min(self.clock.tick() / 1000.0, 1.0 / self.fps), events
@@ -0,0 +1,260 @@
+import pygame
+from src.constants import *
+from src.animator import PieceAnimator
+from src.render_cache import piece_atlas
+from src.controller import GameController
+
+
+class GameView:
+    """
+    Base des vues pygame d'une partie. Les règles et l'état de la partie sont
+    dans le `GameController` ; la vue garde seulement l'état d'affichage
+    (sélection, surlignages, message, historique) et anime les coups que le
+    contrôleur lui signale, déjà appliqués au plateau : la pièce déplacée
+    parcourt ses étapes et les pièces prises restent affichées jusqu'à la fin
+    de l'animation.
+    """
+    def __init__(self, theme, controller=None):
+        self.controller = controller if controller is not None else GameController()
+        self.theme = theme
+        self.animator = PieceAnimator()
+        self.selected = None
+        self.valid_moves = {}
+        self.capture_pieces = []  # Pièces pouvant capturer ce tour
+        self.move_history = []
+        self.message = ""
+        self.animated_piece = None
+        self.taken_pieces = []  # Pièces prises, affichées jusqu'à la fin de l'animation
+        self._drawn = None  # État affiché à l'image précédente (voir `render`)
+        self.controller.subscribe('move', self._on_move)
+        self.controller.subscribe('game_over', self._on_game_over)
+        self.controller.subscribe('position', self._on_position)
+
+    # État de la partie, lu dans le contrôleur
+    @property
+    def board(self):
+        return self.controller.board
+
+    @property
+    def move_cache(self):
+        return self.controller.move_cache
+
+    @property
+    def current_player(self):
+        return self.controller.current_player
+
+    @property
+    def stats(self):
+        return self.controller.stats
+
+    @property
+    def scores(self):
+        return self.controller.scores
+
+    def _on_move(self, record):
+        if record.captured:
+            entry = f"{record.color.upper()} : capture multiple → {record.end[0]+1},{record.end[1]+1}"
+        else:
+            entry = f"{record.color.upper()} : {record.start[0]+1},{record.start[1]+1} → {record.end[0]+1},{record.end[1]+1}"
+        self.move_history.insert(0, entry)
+        if len(self.move_history) > HISTORY_LENGTH:
+            self.move_history.pop()
+        self.selected = None
+        self.valid_moves = {}
+        self.capture_pieces = []
+        self.message = ""
+        self._animate(record)
+
+    def _on_game_over(self, winner):
+        self.message = f"PARTIE TERMINÉE - {winner.upper()} GAGNE!"
+
+    def _on_position(self, board):
+        self._finish_animation()
+        self.selected = None
+        self.valid_moves = {}
+        self.capture_pieces = []
+        self.move_history = []
+        self.message = ""
+
+    @staticmethod
+    def _square_size():
+        surface = pygame.display.get_surface()
+        # Valeurs par défaut si la surface n'est pas disponible
+        win_w, win_h = surface.get_size() if surface else (1103, 712)
+        return min(win_w - PANEL_WIDTH, win_h) // BOARD_SIZE
+
+    def _animate(self, record):
+        """Anime la pièce de case en case le long des étapes du coup."""
+        self._finish_animation()
+        self.animated_piece = record.piece
+        self.taken_pieces = list(record.captured)
+        square_size = self._square_size()
+        piece = record.piece
+        piece.anim_x = None
+        piece.anim_y = None
+        squares = [record.start] + list(record.stops)
+
+        def segment(i):
+            if i + 1 < len(squares):
+                self.animator.start_animation(piece, squares[i], squares[i + 1], BOARD_SIZE, square_size,
+                                              lambda: segment(i + 1))
+        segment(0)
+
+    def _finish_animation(self):
+        if self.animated_piece is not None:
+            self.animated_piece.anim_x = None
+            self.animated_piece.anim_y = None
+        self.animated_piece = None
+        self.taken_pieces = []
+
+    def update(self, dt):
+        self.animator.update(dt)
+        # Fin de la dernière étape (ou animation interrompue)
+        if not self.animator.active and self.animated_piece is not None:
+            self._finish_animation()
+
+    def needs_frames(self):
+        """Vrai tant que l'affichage change sans événement (voir `FrameScheduler`)."""
+        return self.animator.active
+
+    def draw(self, screen, font):
+        """Dessin complet de la vue : plateau puis panneau d'information."""
+        win_w, win_h = screen.get_size()
+        board_pixel_size = min(win_w - PANEL_WIDTH, win_h)
+        screen.fill(self.theme["panel"])
+        self.draw_board(screen, board_pixel_size // BOARD_SIZE)
+        self.draw_panel(screen, font, board_pixel_size)
+
+    def draw_board(self, screen, square_size):
+        raise NotImplementedError
+
+    def draw_panel(self, screen, font, board_pixel_size):
+        raise NotImplementedError
+
+    # --- Rendu par rectangles modifiés ---
+
+    def invalidate(self):
+        """Force un dessin complet à la prochaine image (fenêtre exposée, changement d'écran)."""
+        self._drawn = None
+
+    def render(self, screen, font):
+        """
+        Redessine seulement ce qui a changé depuis l'image précédente et retourne
+        les rectangles modifiés, à passer à `pygame.display.update` ([] si rien
+        n'a changé : aucun dessin pendant que le joueur réfléchit).
+
+        L'état affiché est relevé à chaque image (contenu et marques de chaque
+        case, pièces en mouvement, panneau) et comparé au précédent : les cases
+        qui diffèrent et les positions avant/après des pièces animées sont
+        redessinées en limitant le dessin du plateau à leur enveloppe
+        (`set_clip`), le panneau seulement si son texte a changé. Un changement
+        de fenêtre, de police ou de thème redessine tout.
+        """
+        win_w, win_h = screen.get_size()
+        board_pixel_size = min(win_w - PANEL_WIDTH, win_h)
+        square_size = board_pixel_size // BOARD_SIZE
+        layout = (win_w, win_h, font.get_height(), self.theme["name"])
+        squares, sprites = self.board_state(square_size)
+        frame = (layout, squares, sprites, self.board_overlay(), self.panel_state())
+        previous, self._drawn = self._drawn, frame
+        if previous is None or previous[0] != layout:
+            self.draw(screen, font)
+            return [screen.get_rect()]
+
+        board_area = pygame.Rect(0, 0, board_pixel_size, win_h)
+        dirty = []
+        if frame[3] != previous[3]:
+            dirty.append(board_area)
+        else:
+            old_squares = previous[1]
+            for row, col in squares.keys() | old_squares.keys():
+                if squares.get((row, col)) != old_squares.get((row, col)):
+                    dirty.append(pygame.Rect(col * square_size, row * square_size, square_size, square_size))
+            if sprites != previous[2]:
+                half = square_size // 2
+                for _, _, x, y in previous[2] + sprites:
+                    dirty.append(pygame.Rect(x - half, y - half, square_size, square_size))
+            dirty += self.animated_regions(board_pixel_size, win_h)
+
+        rects = []
+        if dirty:
+            screen.set_clip(dirty[0].unionall(dirty[1:]).clip(board_area))
+            screen.fill(self.theme["panel"])
+            self.draw_board(screen, square_size)
+            screen.set_clip(None)
+            rects = [rect.clip(board_area) for rect in dirty]
+        if frame[4] != previous[4]:
+            panel_area = pygame.Rect(board_pixel_size, 0, win_w - board_pixel_size, win_h)
+            screen.set_clip(panel_area)
+            self.draw_panel(screen, font, board_pixel_size)
+            screen.set_clip(None)
+            rects.append(panel_area)
+        return rects
+
+    def board_state(self, square_size):
+        """
+        État affiché du plateau : ({case: pièces et marques}, pièces en mouvement
+        sous forme (couleur, dame, x, y)).
+        """
+        squares = {}
+        sprites = []
+        for row, line in enumerate(self.board.board):
+            for col, piece in enumerate(line):
+                if piece is None:
+                    continue
+                if piece.anim_x is None or piece.anim_y is None:
+                    squares[(row, col)] = [(piece.color, piece.king)]
+                else:
+                    sprites.append((piece.color, piece.king, piece.anim_x, piece.anim_y))
+        for piece in self.taken_pieces:
+            squares.setdefault((piece.row, piece.col), []).append((piece.color, piece.king))
+        piece = self.animator.piece
+        if self.animator.active and piece is not None:
+            sprites.append((piece.color, piece.king, piece.anim_x, piece.anim_y))
+        for square, mark in self.square_marks():
+            squares.setdefault(square, []).append(mark)
+        return squares, sprites
+
+    def square_marks(self):
+        """Marques dessinées sur les cases : (case, marque)."""
+        if self.selected:
+            yield (self.selected.row, self.selected.col), 'selected'
+        for square in self.valid_moves:
+            yield square, 'destination'
+        for piece in self.capture_pieces:
+            if piece:
+                yield (piece.row, piece.col), 'capture'
+
+    def board_overlay(self):
+        """État d'un voile couvrant tout le plateau (son changement redessine tout le plateau)."""
+        return None
+
+    def animated_regions(self, board_pixel_size, win_h):
+        """Zones du plateau animées en continu, redessinées à chaque image."""
+        return []
+
+    def panel_state(self):
+        """Contenu affiché par le panneau d'information."""
+        stats = tuple((color, s['captures'], s['kings']) for color, s in self.stats.items())
+        return self.current_player, stats, tuple(self.move_history[:8]), self.message
+
+    def draw_taken_pieces(self, screen, square_size):
+        for piece in self.taken_pieces:
+            piece.draw(screen, self.theme, square_size)
+
+    def draw_capture_highlights(self, screen, square_size):
+        """Cadre autour des pièces qui peuvent faire la prise maximale (par-dessus le plateau)."""
+        atlas = piece_atlas(self.theme, square_size)
+        screen.blits([atlas.highlight(piece.row, piece.col) for piece in self.capture_pieces if piece], doreturn=False)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_t:
+            # Switch to next theme
+            current_theme_index = THEMES.index(self.theme)
+            next_theme_index = (current_theme_index + 1) % len(THEMES)
+            self.theme = THEMES[next_theme_index]
+            # Afficher un message pour confirmer le changement de thème
+            self.message = "Thème changé!"
+
+    def set_theme(self, theme):
+        self.theme = theme
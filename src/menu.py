@@ -1,5 +1,6 @@
 import pygame
 from src.constants import *
+from src.render_cache import THEME_PREVIEW_SIZE, get_font, render_text, theme_preview
 
 class Menu:
     def __init__(self):
@@ -29,8 +30,8 @@ class Menu:
         center_x = win_w // 2
         screen.fill((30, 30, 30))
         if self.state == "main":
-            title_font = pygame.font.SysFont(None, int(win_h * 0.08), bold=True)
-            title = title_font.render("Jeu de Dames Internationales", True, WHITE)
+            title_font = get_font(None, int(win_h * 0.08), bold=True)
+            title = render_text(title_font, "Jeu de Dames Internationales", WHITE)
             screen.blit(title, (center_x - title.get_width() // 2, int(win_h * 0.10)))
             btn_w, btn_h = int(win_w * 0.35), int(win_h * 0.09)
             spacing = int(win_h * 0.04)
@@ -44,11 +45,11 @@ class Menu:
                 border = (YELLOW if mouse_over else (180, 180, 180))
                 pygame.draw.rect(screen, color, rect, border_radius=btn_h // 2)
                 pygame.draw.rect(screen, border, rect, 3, border_radius=btn_h // 2)
-                txt = font.render(label, True, (30, 30, 30))
+                txt = render_text(font, label, (30, 30, 30))
                 screen.blit(txt, (rect.x + rect.width // 2 - txt.get_width() // 2, rect.y + rect.height // 2 - txt.get_height() // 2))
         elif self.state == "theme":
-            title_font = pygame.font.SysFont(None, int(win_h * 0.08), bold=True)
-            title = title_font.render("Choix du Thème", True, WHITE)
+            title_font = get_font(None, int(win_h * 0.08), bold=True)
+            title = render_text(title_font, "Choix du Thème", WHITE)
             screen.blit(title, (center_x - title.get_width() // 2, int(win_h * 0.10)))
             btn_w, btn_h = int(win_w * 0.35), int(win_h * 0.09)
             spacing = int(win_h * 0.04)
@@ -65,13 +66,10 @@ class Menu:
                 border = (YELLOW if mouse_over or selected else (180, 180, 180))
                 pygame.draw.rect(screen, color, rect, border_radius=btn_h // 2)
                 pygame.draw.rect(screen, border, rect, 3, border_radius=btn_h // 2)
-                txt = font.render(theme["name"], True, (30, 30, 30))
+                txt = render_text(font, theme["name"], (30, 30, 30))
                 screen.blit(txt, (rect.x + 30, rect.y + rect.height // 2 - txt.get_height() // 2))
-                # Aperçu du thème
-                pygame.draw.rect(screen, theme["light"], (rect.x + btn_w - 110, rect.y + 16, 32, 32), border_radius=8)
-                pygame.draw.rect(screen, theme["dark"], (rect.x + btn_w - 70, rect.y + 16, 32, 32), border_radius=8)
-                pygame.draw.circle(screen, theme["pion_noir"], (rect.x + btn_w - 25, rect.y + 32), 14)
-                pygame.draw.circle(screen, theme["pion_blanc"], (rect.x + btn_w - 55, rect.y + 32), 14)
+                # Aperçu du thème (pré-rendu une fois par thème)
+                screen.blit(theme_preview(theme), (rect.x + btn_w - THEME_PREVIEW_SIZE[0], rect.y + 16))
             # Bouton retour (centré sous les thèmes)
             back_rect = pygame.Rect(center_x - btn_w // 2, start_y + len(THEMES) * (btn_h + spacing) + 10, btn_w, btn_h)
             mouse_over = back_rect.collidepoint(pygame.mouse.get_pos())
@@ -79,7 +77,7 @@ class Menu:
             border = (YELLOW if mouse_over else (180, 180, 180))
             pygame.draw.rect(screen, color, back_rect, border_radius=btn_h // 2)
             pygame.draw.rect(screen, border, back_rect, 3, border_radius=btn_h // 2)
-            txt = font.render("Retour", True, (30, 30, 30))
+            txt = render_text(font, "Retour", (30, 30, 30))
             screen.blit(txt, (back_rect.x + back_rect.width // 2 - txt.get_width() // 2, back_rect.y + back_rect.height // 2 - txt.get_height() // 2))
             self.theme_rects.append(back_rect)
         elif self.state == "choix_difficulte":
@@ -0,0 +1,77 @@
+from src import bitboard
+from src.bitboard import bit_to_square
+
+
+class TurnMoves:
+    """
+    Coups légaux d'un camp dans une position, calculés une seule fois par tour.
+
+    - `moves` : {(row, col): {destination: [positions prises]}}, déjà filtré par
+      la règle de la prise maximale obligatoire ;
+    - `routes` : {(row, col): [(destination, chemin, étapes), ...]} pour les rafles
+      maximales (vide s'il n'y a pas de prise), voir `Board.get_capture_routes` ;
+    - `max_captures` : nombre de pièces prises par ces rafles (0 sans prise).
+    """
+    __slots__ = ('key', 'color', 'moves', 'routes', 'max_captures')
+
+    def __init__(self, key, color, moves, routes, max_captures):
+        self.key = key
+        self.color = color
+        self.moves = moves
+        self.routes = routes
+        self.max_captures = max_captures
+
+    @property
+    def capture_positions(self):
+        """Positions des pièces qui doivent prendre ce tour-ci."""
+        return list(self.routes)
+
+    def move_list(self):
+        """
+        Coups du tour sous la forme (départ, destination, positions prises) de
+        `Board.make_move`, une entrée par rafle maximale : les coups de la racine
+        de la recherche de l'IA, identiques à ceux de `Board.iter_moves`.
+        """
+        if self.max_captures > 0:
+            return [(start, dest, path) for start, paths in self.routes.items() for dest, path, _ in paths]
+        return [(start, dest, []) for start, destinations in self.moves.items() for dest in destinations]
+
+
+class MoveCache:
+    """
+    Cache des coups légaux du tour en cours, partagé par le clic, le surlignage,
+    la détection de fin de partie et l'IA (coups de la racine, `move_list`). L'entrée est indexée par la clé de
+    Zobrist de la position et le camp au trait : tant qu'aucun coup n'est joué,
+    toutes les requêtes d'une frame ou d'un tour retombent sur la même entrée.
+    `invalidate` est appelé quand un coup est validé sur le plateau.
+    """
+    def __init__(self, board):
+        self.board = board
+        self.entry = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, color):
+        board = self.board
+        key = board.position_key(color)
+        entry = self.entry
+        if entry is not None and entry.key == key and entry.color == color:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        routes, max_captures = board.get_capture_routes(color)
+        if max_captures > 0:
+            moves = {start: {dest: path for dest, path, stops in paths} for start, paths in routes.items()}
+        else:
+            moves = {}
+            for origin, dest, _ in bitboard.iter_quiet_moves(board.position, color):
+                start = bit_to_square(origin)
+                if start not in moves:
+                    moves[start] = {}
+                moves[start][bit_to_square(dest)] = []
+        entry = TurnMoves(key, color, moves, routes, max_captures)
+        self.entry = entry
+        return entry
+
+    def invalidate(self):
+        self.entry = None
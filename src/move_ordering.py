@@ -0,0 +1,80 @@
+from src.constants import AI_MAX_DEPTH
+
+# Priorités de tri (les plus grandes passent en premier)
+TT_MOVE_SCORE = 10_000_000
+CAPTURE_SCORE = 5_000_000
+KILLER_SCORE = 4_000_000
+
+
+class MoveOrderer:
+    """
+    Tri des coups pour l'alpha-beta : coup de la table de transposition / variante
+    principale d'abord, puis prises (les plus longues d'abord), puis coups
+    « killer » du même niveau, puis les autres coups selon l'heuristique
+    d'historique. Les coups ont la forme (start, end, captured) de `Board.iter_moves`.
+
+    Une instance peut être partagée entre la recherche et les outils d'analyse ;
+    `record_cutoff` doit être appelé à chaque coupure beta.
+    """
+    def __init__(self, max_ply=AI_MAX_DEPTH + 1):
+        self.killers = [[None, None] for _ in range(max_ply)]
+        self.history = {}
+
+    def score(self, move, ply, tt_move=None):
+        key = (move[0], move[1])
+        if tt_move is not None and key == (tt_move[0], tt_move[1]):
+            return TT_MOVE_SCORE
+        if move[2]:
+            return CAPTURE_SCORE + len(move[2])
+        if ply < len(self.killers):
+            killers = self.killers[ply]
+            if key == killers[0]:
+                return KILLER_SCORE + 1
+            if key == killers[1]:
+                return KILLER_SCORE
+        return min(self.history.get(key, 0), KILLER_SCORE - 1)
+
+    def order(self, moves, ply=0, tt_move=None):
+        """
+        Retourne les coups triés du plus prometteur au moins prometteur.
+        """
+        if len(moves) < 2:
+            return moves
+        score = self.score
+        return sorted(moves, key=lambda move: score(move, ply, tt_move), reverse=True)
+
+    def killer_moves(self, ply):
+        """
+        Coups killer du niveau `ply` sous forme de coups tranquilles (start, end, []).
+        """
+        if ply >= len(self.killers):
+            return []
+        return [(key[0], key[1], []) for key in self.killers[ply] if key is not None]
+
+    def record_cutoff(self, move, ply, depth):
+        """
+        Mémorise un coup tranquille ayant provoqué une coupure beta.
+        """
+        if move[2]:
+            return
+        key = (move[0], move[1])
+        if ply < len(self.killers):
+            killers = self.killers[ply]
+            if killers[0] != key:
+                killers[1] = killers[0]
+                killers[0] = key
+        self.history[key] = self.history.get(key, 0) + depth * depth
+
+    def age(self):
+        """
+        Réduit l'historique entre deux recherches pour privilégier les informations récentes.
+        """
+        for key in list(self.history):
+            self.history[key] //= 2
+        for killers in self.killers:
+            killers[0] = killers[1] = None
+
+    def clear(self):
+        self.history.clear()
+        for killers in self.killers:
+            killers[0] = killers[1] = None
@@ -0,0 +1,287 @@
+"""
+Bibliothèque d'ouvertures : fichier binaire construit hors ligne, lu à
+l'exécution par `mmap` et recherche dichotomique (aucun chargement, aucune
+mémoire allouée pour la table).
+
+    python -m src.opening_book build --plies 4 --depth 8        # par recherche
+    python -m src.opening_book build --import parties.txt       # depuis des parties
+    python -m src.opening_book probe --fen "B:W31,...:B1,..."
+
+Format (petit-boutiste) : un en-tête `HEADER` (signature, version, taille
+d'une entrée, nombre d'entrées) suivi des entrées `ENTRY` triées par clé de
+Zobrist (position + trait) : clé, case de départ, case d'arrivée (indices de
+bit) et poids du coup. Une position a une entrée par coup de la bibliothèque.
+Les coups sont vérifiés contre les coups légaux à la lecture, ce qui écarte
+une éventuelle collision de clés.
+"""
+import argparse
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+
+from src import bitboard
+from src.bitboard import bit_from_number, opponent, position_from_fen, square_number, square_to_bit
+from src.board import Board
+from src.search import Search
+from src.transposition import TranspositionTable
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'opening_book.bin')
+
+MAGIC = b'DAMEBOOK'
+VERSION = 1
+HEADER = struct.Struct('<8sHHI')  # signature, version, taille d'une entrée, nombre d'entrées
+ENTRY = struct.Struct('<QBBH')    # clé, départ, arrivée, poids
+_KEY = struct.Struct('<Q')
+
+MAX_WEIGHT = 0xFFFF
+
+
+class OpeningBook:
+    """
+    Lecture d'une bibliothèque d'ouvertures projetée en mémoire. Lève
+    ValueError si le fichier n'est pas une bibliothèque valide.
+    """
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"{path} : fichier trop court pour une bibliothèque d'ouvertures")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, entry_size, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or entry_size != ENTRY.size or size != HEADER.size + count * ENTRY.size:
+            self._map.close()
+            raise ValueError(f"{path} : bibliothèque d'ouvertures invalide ou d'une autre version")
+        self.count = count
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        """Ouvre la bibliothèque si elle existe et est valide, sinon None."""
+        try:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            if os.path.exists(path):
+                print(f"Bibliothèque d'ouvertures ignorée : {e}")
+            return None
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self._map.close()
+
+    def _key_at(self, index):
+        return _KEY.unpack_from(self._map, HEADER.size + index * ENTRY.size)[0]
+
+    def entries(self, key):
+        """[(départ, arrivée, poids)] en indices de bit pour la clé `key`."""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        result = []
+        offset = HEADER.size + lo * ENTRY.size
+        end = HEADER.size + self.count * ENTRY.size
+        while offset < end:
+            entry_key, origin, dest, weight = ENTRY.unpack_from(self._map, offset)
+            if entry_key != key:
+                break
+            result.append((origin, dest, weight))
+            offset += ENTRY.size
+        return result
+
+    def probe(self, board, color):
+        """
+        Coups de la bibliothèque pour `color` dans la position de `board` :
+        [((départ, arrivée, positions prises), poids)], au format de `make_move`.
+        """
+        entries = self.entries(board.position_key(color))
+        if not entries:
+            return []
+        weights = {(origin, dest): weight for origin, dest, weight in entries}
+        moves = []
+        for move in board.iter_moves(color):
+            weight = weights.pop((square_to_bit(*move[0]), square_to_bit(*move[1])), None)
+            if weight is not None:
+                moves.append((move, weight))
+        return moves
+
+    def choose(self, board, color, rng=random):
+        """Coup de la bibliothèque tiré au hasard selon les poids, ou None hors bibliothèque."""
+        moves = self.probe(board, color)
+        if not moves:
+            return None
+        return rng.choices([move for move, _ in moves], weights=[weight for _, weight in moves])[0]
+
+
+# --- Construction ---
+
+def write_book(path, table):
+    """
+    Écrit la table {clé: [(départ, arrivée, poids), ...]} au format binaire,
+    entrées triées par clé puis par poids décroissant. Retourne le nombre d'entrées.
+    """
+    entries = sorted(
+        ((key, origin, dest, min(max(int(weight), 1), MAX_WEIGHT))
+         for key, moves in table.items()
+         for origin, dest, weight in moves),
+        key=lambda entry: (entry[0], -entry[3]),
+    )
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, ENTRY.size, len(entries)))
+        for entry in entries:
+            f.write(ENTRY.pack(*entry))
+    return len(entries)
+
+
+def _score_moves(search, color, depth):
+    """[(coup, score)] de chaque coup de `color`, cherché à `depth` avec une fenêtre complète."""
+    board = search.board
+    scored = []
+    for move in list(board.iter_moves(color)):
+        undo = board.make_move(move)
+        try:
+            score = search.minimax(depth - 1, float('-inf'), float('inf'), color == 'blanc', 1)
+        finally:
+            board.unmake_move(undo)
+        scored.append((move, score))
+    return scored
+
+
+def build_from_search(plies=4, depth=8, width=3, margin=2, out=sys.stdout):
+    """
+    Cherche chaque position atteignable en moins de `plies` demi-coups depuis
+    la position de départ (tous les coups des deux camps sont développés).
+    Sont retenus au plus `width` coups dont le score est à moins de `margin`
+    du meilleur ; le poids décroît avec l'écart (`margin` + 1 pour le meilleur).
+    """
+    table = {}
+    tt = TranspositionTable()
+    frontier = {bitboard.Position.initial().key('blanc'): (bitboard.Position.initial(), 'blanc')}
+    start = time.perf_counter()
+    for ply in range(plies):
+        next_frontier = {}
+        for key, (position, color) in frontier.items():
+            board = Board.from_position(position)
+            search = Search(board, tt, time_budget=None, node_budget=None)
+            scored = _score_moves(search, color, depth)
+            if not scored:
+                continue
+            sign = 1 if color == 'noir' else -1
+            best = max(sign * score for _, score in scored)
+            kept = sorted(((best - sign * score, move) for move, score in scored), key=lambda item: item[0])
+            table[key] = [(square_to_bit(*move[0]), square_to_bit(*move[1]), margin + 1 - loss)
+                          for loss, move in kept[:width] if loss <= margin]
+            for move, _ in scored:
+                undo = board.make_move(move)
+                child_color = opponent(color)
+                child_key = board.position_key(child_color)
+                if child_key not in table and child_key not in next_frontier:
+                    next_frontier[child_key] = (board.position.copy(), child_color)
+                board.unmake_move(undo)
+        print(f"demi-coup {ply + 1} : {len(frontier)} positions cherchées ({time.perf_counter() - start:.1f} s)", file=out)
+        frontier = next_frontier
+    return table
+
+
+def _parse_move(token, board, color):
+    """Coup légal de `color` noté « 32-28 » ou « 28x19 » (« 28x19x10 » : départ et arrivée), ou None."""
+    separator = 'x' if 'x' in token else '-'
+    parts = token.split(separator)
+    try:
+        numbers = int(parts[0]), int(parts[-1])
+    except ValueError:
+        return None
+    if not all(1 <= n <= 50 for n in numbers):
+        return None
+    origin, dest = bit_from_number(numbers[0]), bit_from_number(numbers[1])
+    for move in board.iter_moves(color):
+        if square_to_bit(*move[0]) == origin and square_to_bit(*move[1]) == dest:
+            return move
+    return None
+
+
+RESULTS = {'2-0', '0-2', '1-1', '1-0', '0-1', '*'}
+
+
+def import_games(lines, plies=8):
+    """
+    Importe des parties en notation officielle, une par ligne (« 32-28 19-23
+    28x19 14x23 ... », numéros de coups et résultat ignorés). Les `plies`
+    premiers demi-coups de chaque partie sont ajoutés ; le poids d'un coup est
+    le nombre de parties qui l'ont joué. Lève ValueError sur un coup illégal.
+    """
+    counts = {}
+    for number, line in enumerate(lines, 1):
+        tokens = [t for t in line.split() if not t.endswith('.') and t not in RESULTS]
+        if not tokens:
+            continue
+        board = Board()
+        color = 'blanc'
+        for token in tokens[:plies]:
+            move = _parse_move(token, board, color)
+            if move is None:
+                raise ValueError(f"ligne {number} : coup illégal ou illisible « {token} »")
+            key = board.position_key(color)
+            pair = (square_to_bit(*move[0]), square_to_bit(*move[1]))
+            counts.setdefault(key, {})
+            counts[key][pair] = counts[key].get(pair, 0) + 1
+            board.make_move(move)
+            color = opponent(color)
+    return {key: [(origin, dest, weight) for (origin, dest), weight in moves.items()] for key, moves in counts.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.opening_book", description="Bibliothèque d'ouvertures.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help="construit la bibliothèque (recherche ou import de parties)")
+    build.add_argument('--plies', type=int, default=None, help="demi-coups couverts (défaut : 4 par recherche, 8 par import)")
+    build.add_argument('--depth', type=int, default=8, help="profondeur de recherche de chaque position (défaut : 8)")
+    build.add_argument('--width', type=int, default=3, help="coups retenus au plus par position (défaut : 3)")
+    build.add_argument('--margin', type=int, default=2, help="écart de score toléré avec le meilleur coup (défaut : 2)")
+    build.add_argument('--import', dest='games', metavar='FICHIER', help="importe des parties (une par ligne) au lieu de chercher")
+    build.add_argument('--output', default=DEFAULT_PATH, help="fichier produit (défaut : src/opening_book.bin)")
+    probe = commands.add_parser('probe', help="affiche les coups de la bibliothèque pour une position")
+    probe.add_argument('--fen', default=None, help="position au format FEN PDN (défaut : position de départ)")
+    probe.add_argument('--book', default=DEFAULT_PATH, help="bibliothèque à lire (défaut : src/opening_book.bin)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'probe':
+        try:
+            position, color = position_from_fen(args.fen) if args.fen else (bitboard.Position.initial(), 'blanc')
+            book = OpeningBook(args.book)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        moves = book.probe(Board.from_position(position), color)
+        total = sum(weight for _, weight in moves)
+        for move, weight in moves:
+            start, end, captured = move
+            label = f"{square_number(square_to_bit(*start))}{'x' if captured else '-'}{square_number(square_to_bit(*end))}"
+            print(f"{label:<8} poids {weight:>5}  ({weight / total:.0%})")
+        if not moves:
+            print("Position hors bibliothèque")
+        return 0
+
+    if args.depth < 1 or args.width < 1 or args.margin < 0 or (args.plies is not None and args.plies < 1):
+        parser.error("--plies, --depth et --width doivent être positifs, --margin au moins 0")
+    if args.games:
+        try:
+            with open(args.games, encoding='utf-8') as f:
+                table = import_games(f, args.plies or 8)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    else:
+        table = build_from_search(args.plies or 4, args.depth, args.width, args.margin)
+    count = write_book(args.output, table)
+    print(f"{len(table)} positions, {count} coups écrits dans {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,263 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from src.constants import *
+from src.bitboard import Position
+from src.board import Board
+from src.search import Search, SearchTimeout
+from src.tablebase import default_tablebase
+from src.transposition import TranspositionTable
+
+# Pool de processus persistant, partagé par toutes les recherches parallèles
+_executor = None
+_executor_workers = 0
+
+# Table de transposition propre à chaque processus de travail, conservée entre les tâches
+_worker_tt = None
+
+
+def _search_move(encoded, color, move, depth, alpha, beta, deadline):
+    """
+    Tâche exécutée dans un processus de travail. La position arrive sous forme
+    de trois masques (blancs, noirs, dames) plutôt que d'un `Board` sérialisé.
+    `deadline` est une heure absolue (time.time()) commune à tous les processus.
+    Retourne (score ou None si le budget est épuisé, nœuds visités).
+    """
+    global _worker_tt
+    if _worker_tt is None:
+        _worker_tt = TranspositionTable()
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        return None, 0
+    board = Board.from_position(Position(*encoded))
+    search = Search(board, _worker_tt, time_budget=remaining, node_budget=None)
+    try:
+        score = search.search_move(color, move, depth, alpha, beta)
+    except SearchTimeout:
+        return None, search.nodes
+    return score, search.nodes
+
+
+def _warm_up():
+    """
+    Tâche de démarrage : le processus importe le moteur, crée sa table de
+    transposition et ouvre les tables de finales avant le premier coup.
+    """
+    global _worker_tt
+    if _worker_tt is None:
+        _worker_tt = TranspositionTable()
+    if AI_TABLEBASE:
+        default_tablebase()
+    return os.getpid()
+
+
+def warm_up_pool(workers=AI_PARALLEL_WORKERS, block=False):
+    """
+    Lance les processus du pool sans attendre le premier coup cherché (le
+    démarrage en mode « spawn » prend une fraction de seconde par processus,
+    prise sinon sur le budget de ce coup). `block` : attendre qu'ils soient prêts.
+    Sans effet avec un seul processus.
+    """
+    workers = worker_count(workers)
+    if workers <= 1:
+        return
+    executor = get_executor(workers)
+    # Une tâche par processus, soumises d'un coup : aucun n'est libre, chacune en démarre un
+    futures = [executor.submit(_warm_up) for _ in range(workers)]
+    if block:
+        wait(futures)
+
+
+def get_executor(workers):
+    """
+    Retourne le pool persistant (créé au premier appel, recréé si la taille change).
+    Les processus sont lancés en mode « spawn » : aucun état SDL n'est hérité.
+    """
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        shutdown_pool()
+        _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        _executor_workers = workers
+    return _executor
+
+
+def shutdown_pool():
+    global _executor, _executor_workers
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _executor_workers = 0
+
+
+def worker_count(workers=AI_PARALLEL_WORKERS):
+    return workers if workers else (os.cpu_count() or 1)
+
+
+class WorkerError(Exception):
+    """
+    Levée quand une tâche du pool échoue (exception dans la tâche, processus
+    mort) : l'itération en cours ne peut pas être complétée en parallèle.
+    """
+
+
+class ParallelSearch:
+    """
+    Recherche parallèle à la racine (« young brothers wait ») : à chaque
+    itération, le premier coup (meilleur coup de l'itération précédente) est
+    cherché localement avec une fenêtre complète, puis ses frères sont envoyés
+    au pool de processus avec la fenêtre bornée par son score. Un frère qui ne
+    dépasse pas cette borne est une borne supérieure et ne peut pas être
+    meilleur ; les autres scores sont exacts, ce qui préserve le résultat de
+    l'alpha-beta séquentiel.
+
+    La profondeur 1 est cherchée dans ce processus : un coup cherché est
+    toujours disponible, même si le pool démarre encore ou qu'aucune itération
+    parallèle n'aboutit dans le budget. Si le pool fait défaut (`WorkerError`),
+    la recherche continue dans ce processus.
+
+    Même interface que `Search` pour `iterative_deepening` et `stop`.
+    """
+    def __init__(self, board, tt=None, workers=AI_PARALLEL_WORKERS, time_budget=AI_TIME_BUDGET, max_depth=AI_MAX_DEPTH):
+        self.board = board
+        self.workers = worker_count(workers)
+        self.search = Search(board, tt, time_budget=time_budget, node_budget=None)
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.nodes = 0
+        self.completed_depth = 0
+        self.best_score = None
+        self.stop_requested = False
+
+    def stop(self):
+        self.stop_requested = True
+        self.search.stop()
+
+    def iterative_deepening(self, color='noir', moves=None):
+        self.nodes = 0
+        self.completed_depth = 0
+        self.best_score = None
+        deadline = time.time() + (self.time_budget or float('inf'))
+
+        moves = list(moves if moves is not None else self.board.iter_moves(color))
+        if not moves:
+            return None
+        best_move = self.search.tablebase_move(color, moves)
+        if best_move is not None:
+            self.best_score = self.search.best_score
+            return best_move
+        orderer = self.search.orderer
+        orderer.age()
+        moves = orderer.order(moves, 0)
+        best_move = moves[0]
+        if len(moves) == 1:
+            return best_move
+
+        parallel = True
+        for depth in range(1, self.max_depth + 1):
+            if deadline - time.time() <= 0 or self.stop_requested:
+                break
+            try:
+                if depth > 1 and parallel:
+                    try:
+                        iteration = self._parallel_iteration(color, moves, depth, deadline)
+                    except WorkerError as e:
+                        print(f"Recherche parallèle interrompue, poursuite dans ce processus : {e}")
+                        parallel = False
+                        iteration = self._serial_iteration(color, moves, depth, deadline)
+                else:
+                    iteration = self._serial_iteration(color, moves, depth, deadline)
+            except SearchTimeout:
+                break
+            if iteration is None:
+                break
+            best_move, self.best_score = iteration
+            self.completed_depth = depth
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+        return best_move
+
+    def _search_move(self, color, move, depth, alpha, beta, deadline):
+        """Score d'un coup cherché dans ce processus, dans le budget restant. Lève SearchTimeout."""
+        remaining = deadline - time.time()
+        if remaining <= 0 or self.stop_requested:
+            raise SearchTimeout()
+        self.search.time_budget = remaining
+        try:
+            return self.search.search_move(color, move, depth, alpha, beta)
+        finally:
+            self.nodes += self.search.nodes
+
+    def _serial_iteration(self, color, moves, depth, deadline):
+        """Itération complète dans ce processus. Retourne (meilleur coup, score) ; lève SearchTimeout."""
+        maximizing = color == 'noir'
+        alpha, beta = float('-inf'), float('inf')
+        best_move, best_score = None, None
+        for move in moves:
+            score = self._search_move(color, move, depth, alpha, beta, deadline)
+            if best_score is None or (maximizing and score > best_score) or (not maximizing and score < best_score):
+                best_move, best_score = move, score
+                if maximizing:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+        return best_move, best_score
+
+    def _parallel_iteration(self, color, moves, depth, deadline):
+        """
+        Itération « young brothers wait ». Retourne (meilleur coup, score), ou
+        None si le budget est épuisé ou l'arrêt demandé avant la fin des frères ;
+        lève SearchTimeout (frère aîné) ou WorkerError (pool défaillant).
+        """
+        maximizing = color == 'noir'
+        # Frère aîné : fenêtre complète, dans ce processus
+        eldest = self._search_move(color, moves[0], depth, float('-inf'), float('inf'), deadline)
+        if maximizing:
+            alpha, beta = eldest, float('inf')
+        else:
+            alpha, beta = float('-inf'), eldest
+
+        # Frères cadets : en parallèle, avec la borne fournie par l'aîné
+        position = self.board.position
+        encoded = (position.white, position.black, position.kings)
+        try:
+            executor = get_executor(self.workers)
+            futures = {
+                executor.submit(_search_move, encoded, color, move, depth, alpha, beta, deadline): move
+                for move in moves[1:]
+            }
+        except (BrokenProcessPool, RuntimeError) as e:
+            shutdown_pool()
+            raise WorkerError(e) from e
+        iteration_move, iteration_score = moves[0], eldest
+        complete = True
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=0.05)
+            for future in done:
+                try:
+                    score, nodes = future.result()
+                except Exception as e:
+                    for other in pending:
+                        other.cancel()
+                    if isinstance(e, BrokenProcessPool):
+                        # Pool inutilisable : recréé à la prochaine recherche
+                        shutdown_pool()
+                    raise WorkerError(e) from e
+                self.nodes += nodes
+                if score is None:
+                    complete = False
+                    continue
+                if (maximizing and score > iteration_score) or (not maximizing and score < iteration_score):
+                    iteration_move, iteration_score = futures[future], score
+            if self.stop_requested or (pending and time.time() > deadline):
+                # Arrêt demandé, ou budget épuisé avant que les tâches en attente ne
+                # démarrent (pool encore en lancement) : itération abandonnée
+                for future in pending:
+                    future.cancel()
+                return None
+        if not complete:
+            return None
+        return iteration_move, iteration_score
@@ -0,0 +1,279 @@
+"""
+Perft : compte les feuilles de l'arbre des coups légaux jusqu'à une profondeur
+donnée, pour mesurer la vitesse de la génération des coups et vérifier que
+deux générateurs produisent exactement le même ensemble de coups.
+
+    python -m src.perft 4                       # position de départ, profondeur 4
+    python -m src.perft 3 --fen "W:W31,K45:B19,20" --divide
+    python -m src.perft 4 --generator board     # via Board.iter_moves
+    python -m src.perft --verify                # contrôle des comptes de référence
+
+Générateurs disponibles : « bitboard » (moteur `src.bitboard`, sur des
+`Position`), « board » (`Board.iter_moves` + make/unmake, l'adaptateur utilisé
+par la recherche) et « naive » (récursion sur les cases, indépendante du
+moteur : la seule vérification qui ne partage pas son code). Un nouveau
+générateur s'ajoute dans GENERATORS avec la même signature.
+"""
+import argparse
+import sys
+import time
+
+from src import bitboard
+from src.bitboard import (KING_MAX_STEPS, bit_to_square, iter_bits, opponent, position_from_fen,
+                          position_to_fen, square_number, square_to_bit)
+from src.board import Board
+from src.constants import BOARD_SIZE
+
+START_FEN = position_to_fen(bitboard.Position.initial(), 'blanc')
+
+# Comptes de référence {profondeur: feuilles}. Toute optimisation de la
+# génération des coups doit les reproduire avec chaque générateur (`--verify`).
+# Les comptes de la position de départ sont ceux, publiés, des dames
+# internationales ; les autres positions exercent les règles propres au jeu
+# (dames limitées, rafles maximales) et sont recoupées par le générateur
+# « naive », qui ne partage pas le code du moteur.
+REFERENCE_COUNTS = [
+    ("position de départ", START_FEN,
+     {1: 9, 2: 81, 3: 658, 4: 4265, 5: 27117, 6: 167140}),
+    ("milieu de partie", "W:W26,27,34,35,36,37,40,41,42,45,46,49:B2,3,4,5,6,7,9,11,14,15,16,17,24,25,28",
+     {1: 12, 2: 107, 3: 680, 4: 5788, 5: 34283}),
+    ("rafles multiples", "W:W23,31,32,36,43,45,46:B5,6,7,12,15,17,27",
+     {1: 1, 2: 5, 3: 47, 4: 210, 5: 2013}),
+    ("rafle de dame", "W:WK4,29,34,37,38,40,41,44,45,46,48:B3,5,10,11,20,25,26",
+     {1: 1, 2: 7, 3: 76, 4: 424, 5: 4385}),
+    ("dames des deux camps", "B:WK46,K28,31,32,33,38,39:BK5,K23,12,13,14,18,19",
+     {1: 8, 2: 36, 3: 200, 4: 1224, 5: 8521}),
+    # Deux rafles maximales prenant des pièces différentes aboutissent sur la même case
+    ("deux rafles vers une case", "W:W18,31,34:B5,7,8,11,14,15,K16,19,20,22,23,24,28,32,33,35,39,40,K43,44,46,47,K50",
+     {1: 4, 2: 10, 3: 15, 4: 195, 5: 552}),
+]
+
+
+def _apply(pos, origin, dest, captured):
+    child = pos.copy()
+    child.move(origin, dest)
+    for bit in captured:
+        child.clear(bit)
+    return child
+
+
+def perft_bitboard(pos, color, depth):
+    """Perft sur le moteur bitboard (une copie de `Position` par coup)."""
+    if depth == 0:
+        return 1
+    moves = bitboard.iter_moves(pos, color)
+    if depth == 1:
+        return sum(1 for _ in moves)
+    other = opponent(color)
+    return sum(perft_bitboard(_apply(pos, *move), other, depth - 1) for move in moves)
+
+
+def perft_board(board, color, depth):
+    """Perft via `Board.iter_moves` (une entrée par rafle, coups joués puis annulés)."""
+    if depth == 0:
+        return 1
+    moves = list(board.iter_moves(color))
+    if depth == 1:
+        return len(moves)
+    other = opponent(color)
+    nodes = 0
+    for move in moves:
+        undo = board.make_move(move)
+        nodes += perft_board(board, other, depth - 1)
+        board.unmake_move(undo)
+    return nodes
+
+
+# Générateur naïf, sans rien partager avec le moteur bitboard hormis `Position`
+DIAGONALS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def _inside(row, col):
+    return 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE
+
+
+def _naive_routes(origin, king, opponents, occupied):
+    """
+    Rafles complètes depuis `origin` par récursion directe : la pièce saute une
+    pièce adverse non encore prise (à distance quelconque pour une dame) et se
+    pose juste derrière ; les pièces prises restent sur le plateau jusqu'à la fin.
+    """
+    routes = []
+
+    def extend(square, taken):
+        extended = False
+        for dr, dc in DIAGONALS:
+            row, col = square[0] + dr, square[1] + dc
+            if king:
+                while _inside(row, col) and (row, col) not in occupied:
+                    row, col = row + dr, col + dc
+            landing = (row + dr, col + dc)
+            if ((row, col) in opponents and (row, col) not in taken
+                    and _inside(*landing) and landing not in occupied):
+                extended = True
+                extend(landing, taken + [(row, col)])
+        if not extended and taken:
+            routes.append((origin, square, taken))
+
+    extend(origin, [])
+    return routes
+
+
+def naive_moves(pos, color):
+    """Coups légaux de `color` sous la forme (origine, destination, bits pris)."""
+    own = {bit_to_square(bit): pos.is_king(bit) for bit in iter_bits(pos.pieces(color))}
+    opponents = {bit_to_square(bit) for bit in iter_bits(pos.pieces(opponent(color)))}
+    occupied = opponents | set(own)
+    routes = [route for origin, king in own.items() for route in _naive_routes(origin, king, opponents, occupied)]
+    moves = {}
+    if routes:
+        best = max(len(taken) for _, _, taken in routes)
+        for origin, end, taken in routes:
+            # Mêmes pièces prises et même arrivée dans un autre ordre : un seul coup
+            if len(taken) == best:
+                moves.setdefault((origin, end, frozenset(taken)), taken)
+        return [(square_to_bit(*origin), square_to_bit(*end), tuple(square_to_bit(*sq) for sq in taken))
+                for (origin, end, _), taken in moves.items()]
+    forward = -1 if color == 'blanc' else 1
+    quiet = []
+    for (row, col), king in own.items():
+        for dr, dc in DIAGONALS:
+            if not king and dr != forward:
+                continue
+            for step in range(1, KING_MAX_STEPS + 1 if king else 2):
+                target = (row + dr * step, col + dc * step)
+                if not _inside(*target) or target in occupied:
+                    break
+                quiet.append((square_to_bit(row, col), square_to_bit(*target), ()))
+    return quiet
+
+
+def perft_naive(pos, color, depth):
+    """Perft sur le générateur naïf (une copie de `Position` par coup)."""
+    if depth == 0:
+        return 1
+    moves = naive_moves(pos, color)
+    if depth == 1:
+        return len(moves)
+    other = opponent(color)
+    return sum(perft_naive(_apply(pos, *move), other, depth - 1) for move in moves)
+
+
+def divide_bitboard(pos, color, depth):
+    """[((origine, destination, bits pris), feuilles)] pour chaque coup de la racine."""
+    other = opponent(color)
+    return [(move, perft_bitboard(_apply(pos, *move), other, depth - 1))
+            for move in bitboard.iter_moves(pos, color)]
+
+
+def divide_board(pos, color, depth):
+    board = Board.from_position(pos)
+    other = opponent(color)
+    result = []
+    for start, end, squares in list(board.iter_moves(color)):
+        undo = board.make_move((start, end, squares))
+        nodes = perft_board(board, other, depth - 1)
+        board.unmake_move(undo)
+        move = (square_to_bit(*start), square_to_bit(*end), tuple(square_to_bit(*sq) for sq in squares))
+        result.append((move, nodes))
+    return result
+
+
+def divide_naive(pos, color, depth):
+    other = opponent(color)
+    return [(move, perft_naive(_apply(pos, *move), other, depth - 1)) for move in naive_moves(pos, color)]
+
+
+# Générateurs comparables : fonction(position, camp, profondeur) -> divide de la racine
+GENERATORS = {
+    'bitboard': divide_bitboard,
+    'board': divide_board,
+    'naive': divide_naive,
+}
+
+
+def move_label(move):
+    """Notation officielle : « 32-28 » pour un déplacement, « 28x19 » pour une prise."""
+    origin, dest, captured = move
+    return f"{square_number(origin)}{'x' if captured else '-'}{square_number(dest)}"
+
+
+def divide(fen, depth, generator='bitboard'):
+    """Retourne [(coup, feuilles)] pour chaque coup de la racine."""
+    pos, color = position_from_fen(fen)
+    if depth < 1:
+        return []
+    return [(move_label(move), nodes) for move, nodes in GENERATORS[generator](pos, color, depth)]
+
+
+def perft(fen, depth, generator='bitboard'):
+    if depth == 0:
+        return 1
+    return sum(nodes for _, nodes in divide(fen, depth, generator))
+
+
+def verify(generators=None, max_depth=None, out=sys.stdout):
+    """
+    Recalcule les comptes de référence avec chaque générateur, puis compare le
+    divide des générateurs entre eux (même ensemble de coups et mêmes comptes
+    pour chaque coup de la racine). Retourne True si tout concorde.
+    """
+    ok = True
+    generators = generators or list(GENERATORS)
+    for generator in generators:
+        for name, fen, counts in REFERENCE_COUNTS:
+            for depth, expected in sorted(counts.items()):
+                if max_depth is not None and depth > max_depth:
+                    continue
+                start = time.perf_counter()
+                nodes = perft(fen, depth, generator)
+                elapsed = time.perf_counter() - start
+                status = "ok" if nodes == expected else f"ÉCHEC (attendu {expected})"
+                ok = ok and nodes == expected
+                print(f"{generator:>8}  {name:<28} profondeur {depth}  {nodes:>10}  {elapsed:7.2f} s  {status}", file=out)
+    if len(generators) > 1:
+        for name, fen, counts in REFERENCE_COUNTS:
+            depth = min(2, max(counts))
+            divides = {generator: sorted(divide(fen, depth, generator)) for generator in generators}
+            same = all(result == divides[generators[0]] for result in divides.values())
+            ok = ok and same
+            print(f"{'divide':>8}  {name:<28} profondeur {depth}  {'identique' if same else 'DIFFÉRENT'}", file=out)
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.perft", description="Compte les feuilles de l'arbre des coups légaux.")
+    parser.add_argument('depth', nargs='?', type=int, default=4, help="profondeur (défaut : 4)")
+    parser.add_argument('--fen', default=START_FEN, help="position au format FEN PDN (défaut : position de départ)")
+    parser.add_argument('--generator', choices=sorted(GENERATORS), default=None,
+                        help="générateur de coups à mesurer (défaut : bitboard ; avec --verify : tous)")
+    parser.add_argument('--divide', action='store_true', help="affiche le compte de chaque coup de la racine")
+    parser.add_argument('--verify', action='store_true', help="vérifie les comptes de référence avec tous les générateurs")
+    parser.add_argument('--max-depth', type=int, default=None, help="avec --verify : ignore les profondeurs supérieures")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        return 0 if verify([args.generator] if args.generator else None, args.max_depth) else 1
+
+    generator = args.generator or 'bitboard'
+    try:
+        position_from_fen(args.fen)
+    except ValueError as e:
+        parser.error(str(e))
+    start = time.perf_counter()
+    if args.divide:
+        nodes = 0
+        for label, count in divide(args.fen, args.depth, generator):
+            print(f"{label:<8} {count}")
+            nodes += count
+        print()
+    else:
+        nodes = perft(args.fen, args.depth, generator)
+    elapsed = time.perf_counter() - start
+    rate = nodes / elapsed if elapsed > 0 else float('inf')
+    print(f"Profondeur {args.depth} : {nodes} feuilles en {elapsed:.3f} s ({rate:,.0f} nœuds/s, générateur {generator})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
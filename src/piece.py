@@ -11,12 +11,11 @@ class Piece:
     def make_king(self):
         self.king = True
     def draw(self, screen, theme, square_size):
-        import pygame
-        x = self.col * square_size + square_size // 2 if self.anim_x is None else self.anim_x
-        y = self.row * square_size + square_size // 2 if self.anim_y is None else self.anim_y
-        pion_color = theme["pion_noir"] if self.color == 'noir' else theme["pion_blanc"]
-        pygame.draw.circle(screen, pion_color, (x, y), square_size//2 - 6)
-        pygame.draw.circle(screen, WHITE, (x, y), square_size//2 - 6, 2)
-        if self.king:
-            pygame.draw.circle(screen, GOLD, (x, y), square_size//2 - 18)
-            pygame.draw.circle(screen, WHITE, (x, y), square_size//2 - 18, 2) 
\ No newline at end of file
+        from src.render_cache import piece_atlas
+        atlas = piece_atlas(theme, square_size)
+        if self.anim_x is None or self.anim_y is None:
+            x = self.col * square_size + square_size // 2
+            y = self.row * square_size + square_size // 2
+            screen.blit(*atlas.piece(self.color, self.king, x, y))
+        else:
+            screen.blit(*atlas.piece(self.color, self.king, self.anim_x, self.anim_y, moving=True))
@@ -0,0 +1,209 @@
+"""
+Surfaces pré-rendues des éléments statiques de l'affichage : le damier d'un
+thème à une taille de case donnée, les sprites des pièces (`PieceAtlas`) et
+les aperçus de thème du menu. Elles ne changent qu'avec le thème ou la taille
+de la fenêtre ; chaque image se contente de les copier par `blit` au lieu de
+redessiner cases et cercles. Les polices système et les textes rendus sont
+gardés de la même façon (`get_font`, `render_text`).
+"""
+from collections import OrderedDict
+
+import pygame
+
+from src.constants import BOARD_SIZE, GOLD, RENDER_CACHE_SIZE, TEXT_CACHE_SIZE, WHITE, YELLOW
+
+
+class SurfaceCache:
+    """
+    Cache LRU de surfaces (ou d'atlas) : `get(key, render)` retourne l'entrée
+    associée à `key`, rendue par `render()` au premier appel. Au-delà de
+    `capacity` entrées (redimensionnements successifs de la fenêtre), la moins
+    récemment utilisée est oubliée.
+    """
+    def __init__(self, capacity=RENDER_CACHE_SIZE):
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, render):
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = render()
+        self._entries[key] = surface
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._entries.clear()
+
+
+def _converted(surface, alpha=False):
+    """Surface au format de l'écran (copie plus rapide), si une fenêtre est ouverte."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+def _theme_key(theme):
+    # Les thèmes sont des dictionnaires (non hachables) : clé sur le nom et les couleurs utilisées
+    return theme["name"], theme["light"], theme["dark"], theme["pion_blanc"], theme["pion_noir"]
+
+
+_board_backgrounds = SurfaceCache()
+
+
+def board_background(theme, square_size):
+    """Damier complet de `theme` pour des cases de `square_size` pixels."""
+    def render():
+        size = BOARD_SIZE * square_size
+        surface = pygame.Surface((size, size))
+        surface.fill(theme["light"])
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                if (row + col) % 2 == 1:
+                    surface.fill(theme["dark"], (col * square_size, row * square_size, square_size, square_size))
+        return _converted(surface)
+    return _board_backgrounds.get((_theme_key(theme), square_size), render)
+
+
+THEME_PREVIEW_SIZE = (110, 32)
+
+_theme_previews = SurfaceCache()
+
+
+def theme_preview(theme):
+    """
+    Aperçu d'un thème pour le menu (case claire, case foncée, pion blanc et
+    pion noir) sur fond transparent, à copier contre le bord droit du bouton.
+    """
+    def render():
+        surface = pygame.Surface(THEME_PREVIEW_SIZE, pygame.SRCALPHA)
+        pygame.draw.rect(surface, theme["light"], (0, 0, 32, 32), border_radius=8)
+        pygame.draw.rect(surface, theme["dark"], (40, 0, 32, 32), border_radius=8)
+        pygame.draw.circle(surface, theme["pion_noir"], (85, 16), 14)
+        pygame.draw.circle(surface, theme["pion_blanc"], (55, 16), 14)
+        return _converted(surface, alpha=True)
+    return _theme_previews.get(_theme_key(theme), render)
+
+
+# Facteur de suréchantillonnage des sprites : rendus en grand puis réduits avec
+# lissage, ce qui donne des bords anticrénelés (pygame.draw ne lisse pas)
+SUPERSAMPLING = 4
+
+
+class PieceAtlas:
+    """
+    Sprites des pièces d'un thème pour une taille de case, lissés, une case de
+    `square_size` pixels chacun : pion et dame de chaque camp, puis le cadre
+    de surlignage des pièces qui doivent prendre. Les pièces se dessinent par
+    `blit` d'une zone de l'atlas au lieu de quatre `pygame.draw.circle` par
+    pièce et par image.
+
+    Une pièce immobile est toujours sur une case foncée : ses sprites sont
+    aussi précomposés sur cette couleur (`opaque`), ce qui réduit le `blit`
+    à une copie. Les sprites transparents (`surface`) servent aux pièces
+    animées, qui passent au-dessus des deux couleurs de case.
+    """
+    SPRITES = (('blanc', False), ('blanc', True), ('noir', False), ('noir', True), 'highlight')
+
+    def __init__(self, theme, square_size):
+        self.square_size = square_size
+        self.half = square_size // 2
+        self.areas = {sprite: pygame.Rect(i * square_size, 0, square_size, square_size)
+                      for i, sprite in enumerate(self.SPRITES)}
+        sprites = self._render(theme, square_size)
+        opaque = pygame.Surface(sprites.get_size())
+        opaque.fill(theme["dark"])
+        opaque.blit(sprites, (0, 0))
+        self.surface = _converted(sprites, alpha=True)
+        self.opaque = _converted(opaque)
+
+    def _render(self, theme, square_size):
+        s = SUPERSAMPLING
+        size = square_size * s
+        big = pygame.Surface((size * len(self.SPRITES), size), pygame.SRCALPHA)
+        # Fond transparent de la couleur du contour : pas de frange sombre après lissage
+        big.fill((*WHITE, 0))
+        centre = (square_size // 2) * s + s // 2
+        radius = square_size // 2 - 6
+        king_radius = square_size // 2 - 18
+        for i, sprite in enumerate(self.SPRITES):
+            left = i * size
+            if sprite == 'highlight':
+                pygame.draw.rect(big, YELLOW, (left + 4 * s, 4 * s, (square_size - 8) * s, (square_size - 8) * s),
+                                 4 * s, border_radius=8 * s)
+                continue
+            color, king = sprite
+            position = (left + centre, centre)
+            if radius > 0:
+                pygame.draw.circle(big, theme["pion_noir"] if color == 'noir' else theme["pion_blanc"], position, radius * s)
+                pygame.draw.circle(big, WHITE, position, radius * s, 2 * s)
+            if king and king_radius > 0:
+                pygame.draw.circle(big, GOLD, position, king_radius * s)
+                pygame.draw.circle(big, WHITE, position, king_radius * s, 2 * s)
+        return pygame.transform.smoothscale(big, (square_size * len(self.SPRITES), square_size))
+
+    def piece(self, color, king, x, y, moving=False):
+        """
+        Arguments de `blit` (surface, destination, zone) d'une pièce centrée en
+        (x, y) : sprite transparent si elle est en mouvement, sinon sur sa case foncée.
+        """
+        return self.surface if moving else self.opaque, (x - self.half, y - self.half), self.areas[(color, king)]
+
+    def highlight(self, row, col):
+        """Arguments de `blit` du cadre de surlignage de la case (row, col)."""
+        return self.surface, (col * self.square_size, row * self.square_size), self.areas['highlight']
+
+
+_piece_atlases = SurfaceCache()
+
+
+def piece_atlas(theme, square_size):
+    """Atlas des pièces de `theme` pour des cases de `square_size` pixels (voir `PieceAtlas`)."""
+    return _piece_atlases.get((_theme_key(theme), square_size), lambda: PieceAtlas(theme, square_size))
+
+
+# --- Polices et textes ---
+
+_fonts = {}
+
+
+def get_font(name, size, bold=False):
+    """
+    Police `pygame.font.SysFont(name, size, bold=bold)`, créée une seule fois
+    par (nom, taille, gras) : la recherche d'une police système est lente.
+    """
+    key = (name, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.SysFont(name, size, bold=bold)
+    return font
+
+
+_texts = SurfaceCache(TEXT_CACHE_SIZE)
+
+
+def render_text(font, text, color):
+    """Surface du texte rendu (anticrénelé) par `font`, gardée dans un cache LRU."""
+    return _texts.get((font, text, color), lambda: font.render(text, True, color))
+
+
+def clear_text_caches():
+    """
+    Oublie polices et textes rendus. À appeler quand la fenêtre est
+    redimensionnée : les tailles de police, proportionnelles à la fenêtre, changent.
+    """
+    _fonts.clear()
+    _texts.clear()
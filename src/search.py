@@ -0,0 +1,335 @@
+import time
+
+from src.constants import *
+from src.transposition import TranspositionTable, EXACT, LOWER, UPPER
+from src.move_ordering import MoveOrderer
+from src import evaluation
+from src.evaluation import MAX_PIECE_VALUE, MAX_SWING
+from src.bitboard import capturers, opponent
+from src.tablebase import default_tablebase
+
+# Marge du delta pruning (déplacement de la pièce qui prend, promotion comprise)
+DELTA_MARGIN = MAX_SWING
+
+
+class SearchTimeout(Exception):
+    """
+    Levée dans minimax quand le budget de temps ou de nœuds est épuisé.
+    """
+
+
+class Search:
+    """
+    Recherche minimax alpha-beta sur un `Board`, avec table de transposition,
+    tri des coups (`MoveOrderer`, remplaçable), recherche de quiescence sur les
+    prises et approfondissement itératif sous budget de temps et de nœuds.
+    Les positions d'au plus `tablebase.max_pieces` pièces ne sont pas cherchées :
+    leur score exact est lu dans les tables de finales (`src.tablebase`).
+    Les scores sont toujours exprimés du point de vue des noirs (l'IA).
+    """
+    def __init__(self, board, tt=None, time_budget=AI_TIME_BUDGET, node_budget=AI_NODE_BUDGET, max_depth=AI_MAX_DEPTH, orderer=None, tablebase=None):
+        self.board = board
+        self.tt = tt if tt is not None else TranspositionTable()
+        self.orderer = orderer if orderer is not None else MoveOrderer()
+        # Tables de finales (None si absentes ou désactivées, voir AI_TABLEBASE)
+        self.tablebase = tablebase if tablebase is not None else (default_tablebase() if AI_TABLEBASE else None)
+        self.tablebase_pieces = self.tablebase.max_pieces if self.tablebase is not None else 0
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.max_depth = max_depth
+        self.nodes = 0
+        self.completed_depth = 0
+        self.best_score = None
+        self.stop_requested = False
+        self._deadline = float('inf')
+        self._node_limit = float('inf')
+
+    def stop(self):
+        """
+        Demande l'arrêt de la recherche en cours (appelable depuis un autre thread).
+        """
+        self.stop_requested = True
+
+    def evaluate(self):
+        """
+        Matériel et tables pièce-case (voir `src.evaluation`), tenus à jour par
+        le plateau à chaque coup joué ou annulé : une simple lecture.
+        """
+        score = self.board.score
+        if AI_EVAL_DEBUG:
+            assert score == evaluation.evaluate(self.board), "évaluation incrémentale désynchronisée"
+        return score
+
+    def probe_tablebase(self, color):
+        """
+        Score exact de la position avec `color` au trait, lu dans les tables de
+        finales (gain le plus court, perte la plus longue), ou None si elle a
+        trop de pièces pour y être.
+        """
+        position = self.board.position
+        if (position.white | position.black).bit_count() > self.tablebase_pieces:
+            return None
+        return self.tablebase.score(position, color)
+
+    def quiesce(self, alpha, beta, maximizing_player, ply=0):
+        """
+        Prolonge une feuille tant que le camp au trait a une prise (obligatoire,
+        avec la règle de la prise maximale). Une position sans prise est calme :
+        son évaluation statique (« stand pat ») est retournée. Si même le gain
+        maximal de la rafle ne peut pas atteindre la fenêtre, la branche est
+        coupée sans être jouée (delta pruning).
+        """
+        self.nodes += 1
+        if self.nodes >= self._node_limit or (self.nodes & 1023 == 0 and (self.stop_requested or time.perf_counter() > self._deadline)):
+            raise SearchTimeout()
+
+        color = 'noir' if maximizing_player else 'blanc'
+        exact = self.probe_tablebase(color)
+        if exact is not None:
+            return exact
+        stand_pat = self.evaluate()
+        takers = capturers(self.board.position, color)
+        if not takers:
+            return stand_pat
+
+        # Toutes les prises légales ont la même longueur (prise maximale obligatoire)
+        moves = list(self.board.iter_captures(color, takers))
+        gain = len(moves[0][2]) * MAX_PIECE_VALUE + DELTA_MARGIN
+        if maximizing_player and stand_pat + gain <= alpha:
+            return stand_pat + gain
+        if not maximizing_player and stand_pat - gain >= beta:
+            return stand_pat - gain
+
+        board = self.board
+        if maximizing_player:
+            best_eval = float('-inf')
+            for move in moves:
+                undo = board.make_move(move)
+                try:
+                    eval = self.quiesce(alpha, beta, False, ply + 1)
+                finally:
+                    board.unmake_move(undo)
+                best_eval = max(best_eval, eval)
+                alpha = max(alpha, eval)
+                if beta <= alpha:
+                    break
+        else:
+            best_eval = float('inf')
+            for move in moves:
+                undo = board.make_move(move)
+                try:
+                    eval = self.quiesce(alpha, beta, True, ply + 1)
+                finally:
+                    board.unmake_move(undo)
+                best_eval = min(best_eval, eval)
+                beta = min(beta, eval)
+                if beta <= alpha:
+                    break
+        return best_eval
+
+    def minimax(self, depth, alpha, beta, maximizing_player, ply=0):
+        if depth <= 0:
+            return self.quiesce(alpha, beta, maximizing_player, ply)
+
+        self.nodes += 1
+        if self.nodes >= self._node_limit or (self.nodes & 1023 == 0 and (self.stop_requested or time.perf_counter() > self._deadline)):
+            raise SearchTimeout()
+
+        color = 'noir' if maximizing_player else 'blanc'
+        exact = self.probe_tablebase(color)
+        if exact is not None:
+            return exact
+        key = self.board.position_key(color)
+        entry = self.tt.probe(key)
+        tt_move = entry[4] if entry is not None else None
+        if entry is not None and entry[1] >= depth:
+            bound, score = entry[2], entry[3]
+            if bound == EXACT:
+                return score
+            if bound == LOWER:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if beta <= alpha:
+                return score
+        alpha_orig, beta_orig = alpha, beta
+
+        board = self.board
+        best_move = None
+        if maximizing_player:
+            best_eval = float('-inf')
+            for move in self.ordered_moves(color, ply, tt_move):
+                # Jouer le coup (prises et promotion comprises), évaluer, puis l'annuler
+                undo = board.make_move(move)
+                try:
+                    eval = self.minimax(depth - 1, alpha, beta, False, ply + 1)
+                finally:
+                    board.unmake_move(undo)
+
+                if eval > best_eval:
+                    best_eval = eval
+                    best_move = move
+                alpha = max(alpha, eval)
+                if beta <= alpha:
+                    self.orderer.record_cutoff(move, ply, depth)
+                    break
+        else:
+            best_eval = float('inf')
+            for move in self.ordered_moves(color, ply, tt_move):
+                undo = board.make_move(move)
+                try:
+                    eval = self.minimax(depth - 1, alpha, beta, True, ply + 1)
+                finally:
+                    board.unmake_move(undo)
+
+                if eval < best_eval:
+                    best_eval = eval
+                    best_move = move
+                beta = min(beta, eval)
+                if beta <= alpha:
+                    self.orderer.record_cutoff(move, ply, depth)
+                    break
+
+        if best_move is None:
+            # Aucun coup possible
+            return self.evaluate()
+        if best_eval <= alpha_orig:
+            bound = UPPER
+        elif best_eval >= beta_orig:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.tt.store(key, depth, bound, best_eval, best_move)
+        return best_eval
+
+    def ordered_moves(self, color, ply, tt_move=None):
+        """
+        Produit les coups de `color` par étapes, pour que la génération s'arrête
+        dès qu'une coupure est trouvée : prises (forcées, triées) s'il y en a ;
+        sinon coup de la table de transposition, puis coups killer, puis les
+        autres déplacements simples triés par historique. Seules les étapes
+        table de transposition et killers sont paresseuses : les autres
+        déplacements sont tous générés et triés avant d'être produits.
+        """
+        board = self.board
+        orderer = self.orderer
+        # Pièces capables de prendre, calculées une seule fois par nœud
+        takers = capturers(board.position, color)
+        if takers:
+            yield from orderer.order(list(board.iter_captures(color, takers)), ply, tt_move)
+            return
+        tried = []
+        candidates = orderer.killer_moves(ply)
+        if tt_move is not None:
+            candidates.insert(0, tt_move)
+        for move in candidates:
+            key = (move[0], move[1])
+            if not move[2] and key not in tried and board.is_legal_quiet_move(color, move):
+                tried.append(key)
+                yield (move[0], move[1], [])
+        rest = [move for move in board.iter_quiet_moves(color) if (move[0], move[1]) not in tried]
+        yield from orderer.order(rest, ply)
+
+    def search_root(self, color, depth, moves):
+        """
+        Cherche à profondeur fixe parmi `moves` (dans l'ordre donné).
+        Retourne (meilleur coup, score).
+        """
+        maximizing = color == 'noir'
+        alpha, beta = float('-inf'), float('inf')
+        best_move = None
+        best_score = float('-inf') if maximizing else float('inf')
+        for move in moves:
+            undo = self.board.make_move(move)
+            try:
+                score = self.minimax(depth - 1, alpha, beta, not maximizing, 1)
+            finally:
+                self.board.unmake_move(undo)
+            if maximizing and score > best_score:
+                best_score, best_move = score, move
+                alpha = max(alpha, score)
+            elif not maximizing and score < best_score:
+                best_score, best_move = score, move
+                beta = min(beta, score)
+        return best_move, best_score
+
+    def tablebase_move(self, color, moves):
+        """
+        Meilleur coup parmi `moves` lu dans les tables de finales, sans recherche,
+        si la position y est ; sinon None.
+        """
+        if self.probe_tablebase(color) is None:
+            return None
+        board = self.board
+        sign = 1 if color == 'noir' else -1
+        best_move, best_score = None, None
+        for move in moves:
+            undo = board.make_move(move)
+            try:
+                score = self.probe_tablebase(opponent(color))
+            finally:
+                board.unmake_move(undo)
+            if best_score is None or sign * score > sign * best_score:
+                best_move, best_score = move, score
+        self.best_score = best_score
+        return best_move
+
+    def _start_budget(self):
+        self.nodes = 0
+        self._deadline = time.perf_counter() + self.time_budget if self.time_budget else float('inf')
+        self._node_limit = self.node_budget if self.node_budget else float('inf')
+
+    def search_move(self, color, move, depth, alpha, beta):
+        """
+        Score d'un coup de `color` cherché à `depth` (coup compris) dans la fenêtre
+        (alpha, beta), sous le budget de la recherche. Lève SearchTimeout si le
+        budget est épuisé.
+        """
+        self._start_budget()
+        undo = self.board.make_move(move)
+        try:
+            return self.minimax(depth - 1, alpha, beta, color != 'noir', 1)
+        finally:
+            self.board.unmake_move(undo)
+            self._deadline = float('inf')
+            self._node_limit = float('inf')
+
+    def iterative_deepening(self, color='noir', moves=None):
+        """
+        Approfondit la recherche (profondeur 1, 2, 3...) jusqu'à épuisement du
+        budget et retourne le meilleur coup de la dernière itération complète,
+        ou None si `color` n'a aucun coup. `moves` : coups de la racine, lus
+        dans le cache du tour (`TurnMoves.move_list`) ; générés par défaut.
+        """
+        self._start_budget()
+        self.completed_depth = 0
+        self.best_score = None
+
+        moves = list(moves if moves is not None else self.board.iter_moves(color))
+        if not moves:
+            return None
+        best_move = self.tablebase_move(color, moves)
+        if best_move is not None:
+            return best_move
+        self.orderer.age()
+        entry = self.tt.probe(self.board.position_key(color))
+        moves = self.orderer.order(moves, 0, entry[4] if entry is not None else None)
+        best_move = moves[0]
+        if len(moves) == 1:
+            return best_move
+        try:
+            for depth in range(1, self.max_depth + 1):
+                try:
+                    move, score = self.search_root(color, depth, moves)
+                except SearchTimeout:
+                    break
+                best_move, self.best_score, self.completed_depth = move, score, depth
+                # Le meilleur coup de l'itération précédente est essayé en premier
+                moves.remove(move)
+                moves.insert(0, move)
+                if self.stop_requested or time.perf_counter() > self._deadline:
+                    break
+        finally:
+            self._deadline = float('inf')
+            self._node_limit = float('inf')
+        return best_move
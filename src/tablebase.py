@@ -0,0 +1,459 @@
+"""
+Tables de finales : résultat exact (gain, perte ou nulle) et distance à la fin
+de partie de toutes les positions d'au plus `max_pieces` pièces, calculés hors
+ligne par analyse rétrograde et lus à l'exécution par `mmap`.
+
+    python -m src.tablebase build --pieces 3       # écrit src/tablebase.bin
+    python -m src.tablebase probe --fen "W:WK46:BK5,K10"
+
+Les positions sont vues du camp au trait : celui-ci joue toujours « vers le
+haut » comme les blancs, une position où les noirs ont le trait étant tournée
+d'un demi-tour (case n -> 51 - n) avec les couleurs échangées. Une table par
+signature matérielle (pions et dames du camp au trait, puis de l'adversaire).
+Le résultat est celui du camp au trait (le camp sans coup perd) et la distance
+est le nombre de demi-coups jusqu'à la fin avec le meilleur jeu des deux camps
+(gain le plus rapide, perte la plus lente), bornée à 255.
+
+Format (petit-boutiste) : un en-tête `HEADER` (signature, version, nombre de
+pièces maximal, nombre de tables), un répertoire d'entrées `TABLE` (signature
+matérielle, décalage, nombre de positions), puis pour chaque table les
+résultats sur 2 bits (4 positions par octet) suivis des distances sur un octet.
+"""
+import argparse
+import itertools
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+
+from src import bitboard
+from src.bitboard import PROMOTION_MASK, bit_from_number, iter_bits, position_from_fen, square_number
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tablebase.bin')
+
+MAGIC = b'DAMEDTB\0'
+VERSION = 1
+HEADER = struct.Struct('<8sHHI')   # signature, version, pièces maximum, nombre de tables
+TABLE = struct.Struct('<4BQI')     # pions et dames du trait, de l'adversaire, décalage, positions
+
+# Résultats, du point de vue du camp au trait
+DRAW = 0
+WIN = 1
+LOSS = 2
+
+MAX_DISTANCE = 255
+
+# Score de la recherche d'une position gagnée (moins la distance, pour préférer le gain le plus court)
+TABLEBASE_WIN = 10000
+
+NUM_SQUARES = 50
+SQUARE_BITS = [bit_from_number(n + 1) for n in range(NUM_SQUARES)]
+BIT_SQUARES = {bit: n for n, bit in enumerate(SQUARE_BITS)}
+# Demi-tour du plateau : la case n devient la case 51 - n (indices 0 à 49 : s -> 49 - s)
+FLIP = [NUM_SQUARES - 1 - s for s in range(NUM_SQUARES)]
+
+_BINOMIAL = [[0] * 5 for _ in range(NUM_SQUARES + 1)]
+for _n in range(NUM_SQUARES + 1):
+    _BINOMIAL[_n][0] = 1
+    for _k in range(1, 5):
+        _BINOMIAL[_n][_k] = _BINOMIAL[_n - 1][_k - 1] + _BINOMIAL[_n - 1][_k] if _n else 0
+
+
+def _rank(squares):
+    """Rang d'un ensemble de cases triées parmi les C(50, k) combinaisons."""
+    return sum(_BINOMIAL[s][j + 1] for j, s in enumerate(squares))
+
+
+def _unrank(index, k):
+    """Ensemble trié de k cases de rang `index` (inverse de `_rank`)."""
+    squares = [0] * k
+    for j in range(k, 0, -1):
+        s = j - 1
+        while _BINOMIAL[s + 1][j] <= index:
+            s += 1
+        squares[j - 1] = s
+        index -= _BINOMIAL[s][j]
+    return squares
+
+
+def table_size(signature):
+    size = 1
+    for count in signature:
+        size *= _BINOMIAL[NUM_SQUARES][count]
+    return size
+
+
+def signature_index(groups):
+    """
+    (signature, indice) d'une position donnée par ses quatre groupes de cases
+    (pions et dames du trait, pions et dames de l'adversaire), du point de vue du trait.
+    """
+    index = 0
+    for squares in groups:
+        index = index * _BINOMIAL[NUM_SQUARES][len(squares)] + _rank(sorted(squares))
+    return tuple(len(squares) for squares in groups), index
+
+
+def _groups_of(signature, index):
+    groups = []
+    for count in reversed(signature):
+        index, rank = divmod(index, _BINOMIAL[NUM_SQUARES][count])
+        groups.append(_unrank(rank, count))
+    groups.reverse()
+    return groups
+
+
+def position_groups(position, color):
+    """Groupes de cases de `position` vue du camp `color` au trait (voir `signature_index`)."""
+    own, opp = (position.white, position.black) if color == 'blanc' else (position.black, position.white)
+    groups = []
+    for mask in (own & ~position.kings, own & position.kings, opp & ~position.kings, opp & position.kings):
+        squares = [BIT_SQUARES[bit] for bit in iter_bits(mask)]
+        groups.append(squares if color == 'blanc' else [FLIP[s] for s in squares])
+    return groups
+
+
+def signatures(max_pieces):
+    """
+    Signatures matérielles d'au plus `max_pieces` pièces (au moins une par camp),
+    dans l'ordre de calcul : une prise mène à moins de pièces, une promotion à
+    moins de pions, donc à une table déjà calculée.
+    """
+    result = []
+    for total in range(2, max_pieces + 1):
+        for signature in itertools.product(range(total), repeat=4):
+            if (sum(signature) == total and signature[0] + signature[1] >= 1
+                    and signature[2] + signature[3] >= 1):
+                result.append(signature)
+    result.sort(key=lambda sig: (sum(sig), sig[0] + sig[2]))
+    return result
+
+
+class Tablebase:
+    """
+    Lecture des tables de finales projetées en mémoire. Lève ValueError si le
+    fichier n'est pas un fichier de tables valide.
+    """
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"{path} : fichier trop court pour des tables de finales")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, max_pieces, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or size < HEADER.size + count * TABLE.size:
+            self._map.close()
+            raise ValueError(f"{path} : tables de finales invalides ou d'une autre version")
+        self.max_pieces = max_pieces
+        self.tables = {}
+        for i in range(count):
+            *signature, offset, positions = TABLE.unpack_from(self._map, HEADER.size + i * TABLE.size)
+            if offset + (positions + 3) // 4 + positions > size:
+                self._map.close()
+                raise ValueError(f"{path} : table {signature} tronquée")
+            self.tables[tuple(signature)] = (offset, positions)
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        """Ouvre les tables si le fichier existe et est valide, sinon None."""
+        try:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            if os.path.exists(path):
+                print(f"Tables de finales ignorées : {e}")
+            return None
+
+    def close(self):
+        self._map.close()
+
+    def covers(self, pieces):
+        """Vrai si les positions de `pieces` pièces au total sont dans les tables."""
+        return pieces <= self.max_pieces
+
+    def probe(self, position, color):
+        """
+        (résultat, distance) de `position` avec `color` au trait, du point de vue
+        de `color` (WIN, LOSS ou DRAW), ou None si la position n'est pas couverte.
+        """
+        signature, index = signature_index(position_groups(position, color))
+        if signature[0] + signature[1] == 0:
+            return LOSS, 0
+        if signature[2] + signature[3] == 0:
+            # Adversaire sans pièce : ne se produit pas en partie (la partie est finie)
+            return WIN, 0
+        table = self.tables.get(signature)
+        if table is None:
+            return None
+        offset, positions = table
+        result = (self._map[offset + index // 4] >> (2 * (index % 4))) & 3
+        distance = self._map[offset + (positions + 3) // 4 + index]
+        return result, distance
+
+    def score(self, position, color):
+        """
+        Score de la recherche (du point de vue des noirs) de `position` avec
+        `color` au trait, ou None si la position n'est pas couverte.
+        """
+        entry = self.probe(position, color)
+        if entry is None:
+            return None
+        result, distance = entry
+        if result == DRAW:
+            return 0
+        score = TABLEBASE_WIN - distance if result == WIN else distance - TABLEBASE_WIN
+        return score if color == 'noir' else -score
+
+
+_default = None
+_default_loaded = False
+
+
+def default_tablebase():
+    """Tables livrées avec le jeu (src/tablebase.bin), ouvertes au premier appel ; None si absentes."""
+    global _default, _default_loaded
+    if not _default_loaded:
+        _default = Tablebase.load()
+        _default_loaded = True
+    return _default
+
+
+# --- Construction ---
+
+def _successors(signature, groups):
+    """
+    Coups du camp au trait (joué comme les blancs) : liste de (signature, indice)
+    des positions atteintes, vues de l'adversaire qui a alors le trait. Une
+    signature sans pièce pour le trait indique que le coup a pris la dernière pièce.
+    """
+    own_men, own_kings, opp_men, opp_kings = groups
+    white = kings = black = 0
+    for s in own_men:
+        white |= 1 << SQUARE_BITS[s]
+    for s in own_kings:
+        white |= 1 << SQUARE_BITS[s]
+        kings |= 1 << SQUARE_BITS[s]
+    for s in opp_men:
+        black |= 1 << SQUARE_BITS[s]
+    for s in opp_kings:
+        black |= 1 << SQUARE_BITS[s]
+        kings |= 1 << SQUARE_BITS[s]
+    position = bitboard.Position(white, black, kings)
+    children = []
+    for origin, dest, captured in bitboard.iter_moves(position, 'blanc'):
+        start, end = BIT_SQUARES[origin], BIT_SQUARES[dest]
+        taken = {BIT_SQUARES[bit] for bit in captured}
+        men = [s for s in own_men if s != start]
+        crowned = [s for s in own_kings if s != start]
+        if (kings >> origin) & 1 or (PROMOTION_MASK['blanc'] >> dest) & 1:
+            crowned.append(end)
+        else:
+            men.append(end)
+        children.append(signature_index((
+            [FLIP[s] for s in opp_men if s not in taken],
+            [FLIP[s] for s in opp_kings if s not in taken],
+            [FLIP[s] for s in men],
+            [FLIP[s] for s in crowned],
+        )))
+    return children
+
+
+def _valid(groups):
+    """Cases distinctes, aucun pion sur sa rangée de promotion (il y serait devenu dame)."""
+    squares = [s for group in groups for s in group]
+    if len(set(squares)) != len(squares):
+        return False
+    return all(s >= 5 for s in groups[0]) and all(s < NUM_SQUARES - 5 for s in groups[2])
+
+
+def solve(group, solved, out=sys.stdout):
+    """
+    Analyse rétrograde d'un groupe de signatures qui se répondent (une signature
+    et son symétrique, l'adversaire ayant le trait après un coup calme). Les
+    coups vers d'autres signatures (prises, promotions) sont lus dans `solved`,
+    {signature: (résultats, distances)} déjà calculés. Les positions sont
+    finalisées par distance croissante : perte en d si tous les coups mènent à
+    un gain adverse (le plus lent en d - 1), gain en d si un coup mène à une
+    perte adverse en d - 1. Les positions jamais finalisées sont nulles.
+    """
+    offsets = {}
+    total = 0
+    for signature in group:
+        offsets[signature] = total
+        total += table_size(signature)
+    results = array('B', bytes(total))
+    distances = array('H', bytes(2 * total))
+    final = bytearray(total)
+    remaining = array('H', bytes(2 * total))   # coups internes au groupe pas encore résolus en gain adverse
+    slowest = array('H', bytes(2 * total))     # distance de la perte la plus lente connue
+    escapes = bytearray(total)                 # un coup hors du groupe ne mène pas à un gain adverse
+    edges = []                                 # (parent, enfant) internes au groupe
+    buckets = {}
+
+    start = time.perf_counter()
+    for signature in group:
+        base = offsets[signature]
+        for index in range(table_size(signature)):
+            groups = _groups_of(signature, index)
+            node = base + index
+            if not _valid(groups):
+                final[node] = 1
+                continue
+            best_win = None
+            for child_signature, child_index in _successors(signature, groups):
+                if child_signature[0] + child_signature[1] == 0:
+                    child = (LOSS, 0)
+                elif child_signature in offsets:
+                    edges.append((node, offsets[child_signature] + child_index))
+                    remaining[node] += 1
+                    continue
+                else:
+                    child_results, child_distances = solved[child_signature]
+                    child = (child_results[child_index], child_distances[child_index])
+                if child[0] == LOSS:
+                    best_win = child[1] + 1 if best_win is None else min(best_win, child[1] + 1)
+                elif child[0] == DRAW:
+                    escapes[node] = 1
+                else:
+                    slowest[node] = max(slowest[node], child[1] + 1)
+            if best_win is not None:
+                escapes[node] = 1
+                buckets.setdefault(best_win, []).append((node, WIN))
+            elif not remaining[node] and not escapes[node]:
+                # Tous les coups (ou aucun) mènent à un gain adverse
+                buckets.setdefault(slowest[node], []).append((node, LOSS))
+    print(f"  {'/'.join(map(describe, group))} : {total} positions, {len(edges)} coups internes "
+          f"({time.perf_counter() - start:.1f} s)", file=out)
+
+    # Prédécesseurs internes au groupe, en tableau compact
+    first = array('I', bytes(4 * (total + 1)))
+    for _, child in edges:
+        first[child + 1] += 1
+    for node in range(total):
+        first[node + 1] += first[node]
+    fill = array('I', first)
+    parents = array('I', bytes(4 * len(edges)))
+    for parent, child in edges:
+        parents[fill[child]] = parent
+        fill[child] += 1
+    del edges, fill
+
+    distance = 0
+    while buckets:
+        level = buckets.pop(distance, ())
+        for node, result in level:
+            if final[node]:
+                continue
+            final[node] = 1
+            results[node] = result
+            distances[node] = distance
+            for i in range(first[node], first[node + 1]):
+                parent = parents[i]
+                if final[parent]:
+                    continue
+                if result == LOSS:
+                    buckets.setdefault(distance + 1, []).append((parent, WIN))
+                else:
+                    remaining[parent] -= 1
+                    slowest[parent] = max(slowest[parent], distance + 1)
+                    if not remaining[parent] and not escapes[parent]:
+                        buckets.setdefault(slowest[parent], []).append((parent, LOSS))
+        distance += 1
+
+    for signature in group:
+        base = offsets[signature]
+        size = table_size(signature)
+        solved[signature] = (results[base:base + size], distances[base:base + size])
+    return solved
+
+
+def describe(signature):
+    """« km-k » : pions (m) et dames (k) du trait, puis de l'adversaire."""
+    own_men, own_kings, opp_men, opp_kings = signature
+    return f"{'k' * own_kings}{'m' * own_men}-{'k' * opp_kings}{'m' * opp_men}"
+
+
+def build(max_pieces=3, out=sys.stdout):
+    """Calcule toutes les tables d'au plus `max_pieces` pièces : {signature: (résultats, distances)}."""
+    solved = {}
+    for signature in signatures(max_pieces):
+        if signature in solved:
+            continue
+        mirror = signature[2:] + signature[:2]
+        solve([signature] if mirror == signature else [signature, mirror], solved, out)
+    return solved
+
+
+def write_tablebase(path, solved, max_pieces):
+    """Écrit les tables calculées par `build` au format binaire. Retourne la taille du fichier."""
+    order = [signature for signature in signatures(max_pieces) if signature in solved]
+    offset = HEADER.size + len(order) * TABLE.size
+    directory = []
+    for signature in order:
+        positions = len(solved[signature][0])
+        directory.append(TABLE.pack(*signature, offset, positions))
+        offset += (positions + 3) // 4 + positions
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, max_pieces, len(order)))
+        f.write(b''.join(directory))
+        for signature in order:
+            results, distances = solved[signature]
+            packed = bytearray((len(results) + 3) // 4)
+            for index, result in enumerate(results):
+                if result:
+                    packed[index >> 2] |= result << (2 * (index & 3))
+            f.write(packed)
+            f.write(bytes(min(d, MAX_DISTANCE) for d in distances))
+    return offset
+
+
+RESULT_NAMES = {WIN: "gain", LOSS: "perte", DRAW: "nulle"}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.tablebase", description="Tables de finales.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build_parser = commands.add_parser('build', help="calcule les tables par analyse rétrograde")
+    build_parser.add_argument('--pieces', type=int, default=3, help="nombre de pièces maximal (2 à 4, défaut : 3)")
+    build_parser.add_argument('--output', default=DEFAULT_PATH, help="fichier produit (défaut : src/tablebase.bin)")
+    probe = commands.add_parser('probe', help="affiche le résultat exact d'une position et ses coups")
+    probe.add_argument('--fen', required=True, help="position au format FEN PDN")
+    probe.add_argument('--tables', default=DEFAULT_PATH, help="tables à lire (défaut : src/tablebase.bin)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'probe':
+        try:
+            position, color = position_from_fen(args.fen)
+            tablebase = Tablebase(args.tables)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        entry = tablebase.probe(position, color)
+        if entry is None:
+            print(f"Position hors tables (plus de {tablebase.max_pieces} pièces)")
+            return 0
+        print(f"{color} au trait : {RESULT_NAMES[entry[0]]}" + (f" en {entry[1]} demi-coups" if entry[0] != DRAW else ""))
+        for origin, dest, captured in bitboard.iter_moves(position, color):
+            child = position.copy()
+            for bit in captured:
+                child.clear(bit)
+            child.move(origin, dest)
+            result, distance = tablebase.probe(child, bitboard.opponent(color))
+            label = f"{square_number(origin)}{'x' if captured else '-'}{square_number(dest)}"
+            # Résultat de l'adversaire après le coup : sa perte est notre gain
+            outcome = {WIN: LOSS, LOSS: WIN, DRAW: DRAW}[result]
+            print(f"  {label:<8} {RESULT_NAMES[outcome]}" + (f" en {distance + 1}" if outcome != DRAW else ""))
+        return 0
+
+    if not 2 <= args.pieces <= 4:
+        parser.error("--pieces doit être compris entre 2 et 4")
+    start = time.perf_counter()
+    solved = build(args.pieces)
+    size = write_tablebase(args.output, solved, args.pieces)
+    print(f"{len(solved)} tables, {size / 1024:.0f} Ko écrits dans {args.output} ({time.perf_counter() - start:.1f} s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
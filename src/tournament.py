@@ -0,0 +1,328 @@
+"""
+Tournoi IA contre IA sans affichage : les parties sont réparties sur un pool de
+processus et jouées sans pygame ni animation, avec les mêmes choix de coups
+que le jeu (`src.ai_player`).
+
+    python -m src.tournament easy medium --games 200
+    python -m src.tournament hard "hard:nodes=5000" "search:depth=4" --games 100 --workers 8
+    python -m src.tournament medium "hard:time=0.2" --output tournoi.jsonl
+
+Un joueur s'écrit `niveau[:option=valeur,...]` : niveau parmi easy, medium,
+hard, ou « search » (approfondissement itératif pour tous les coups, prises
+comprises) ; options `time` (secondes par coup), `nodes` (nœuds par coup) et
+`depth` (profondeur maximale) pour régler la recherche.
+
+Chaque paire de joueurs dispute `--games` parties en alternant les couleurs.
+Une partie est nulle au-delà de `--max-moves` demi-coups ou quand une position
+revient `--repetitions` fois. Les résultats sont écrits au fil de l'eau, une
+partie par ligne JSON, puis une dernière ligne résume le tournoi avec les
+estimations Elo.
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+
+from src.constants import *
+from src.ai_player import LEVELS, choose_move
+from src.bitboard import opponent
+from src.controller import GameController, IllegalMoveError
+from src.search import Search
+from src.transposition import TranspositionTable
+
+MAX_MOVES = 300       # demi-coups avant de déclarer la partie nulle
+REPETITIONS = 3       # occurrences d'une même position (camp au trait compris) pour la nulle
+TOURNAMENT_TT_MB = 4  # table de transposition de chaque joueur (deux par processus)
+
+SEARCH_OPTIONS = {'time': float, 'nodes': int, 'depth': int}
+
+
+def parse_player(spec):
+    """
+    « hard:nodes=5000,depth=6 » -> {'level': 'hard', 'time': ..., 'nodes': 5000, 'depth': 6}.
+    Lève ValueError si la description est invalide. Sans option, la recherche
+    garde les réglages du jeu (AI_TIME_BUDGET, AI_NODE_BUDGET, AI_MAX_DEPTH).
+    """
+    level, _, options = spec.partition(':')
+    if level not in LEVELS + ('search',):
+        raise ValueError(f"niveau inconnu « {level} » (attendu : {', '.join(LEVELS + ('search',))})")
+    player = {'level': level, 'time': AI_TIME_BUDGET, 'nodes': AI_NODE_BUDGET, 'depth': AI_MAX_DEPTH}
+    if not options:
+        return player
+    # Budget en nœuds ou en profondeur seul : pas de limite de temps (reproductible)
+    player['time'] = None
+    for option in options.split(','):
+        name, _, value = option.partition('=')
+        if name not in SEARCH_OPTIONS or not value:
+            raise ValueError(f"option invalide « {option} » (attendu : {', '.join(SEARCH_OPTIONS)})")
+        try:
+            player[name] = SEARCH_OPTIONS[name](value)
+        except ValueError:
+            raise ValueError(f"valeur invalide pour {name} : « {value} »") from None
+    return player
+
+
+class _Player:
+    """Un camp d'une partie : configuration, recherche propre et statistiques."""
+    def __init__(self, spec, board, seed):
+        config = parse_player(spec)
+        self.spec = spec
+        self.level = config['level']
+        self.search = Search(board, TranspositionTable(TOURNAMENT_TT_MB), time_budget=config['time'],
+                             node_budget=config['nodes'], max_depth=config['depth'])
+        self.rng = random.Random(seed)
+        self.moves = 0
+        self.time = 0.0
+        self.nodes = 0
+
+    def play(self, board, turn, color):
+        self.search.nodes = 0
+        start = time.perf_counter()
+        if self.level == 'search':
+            move = self.search.iterative_deepening(color, turn.move_list())
+        else:
+            move = choose_move(board, turn, self.level, self.search, color, self.rng)
+        self.time += time.perf_counter() - start
+        self.nodes += self.search.nodes
+        self.moves += 1
+        return move
+
+    def stats(self):
+        return {
+            'moves': self.moves,
+            'time_per_move': self.time / self.moves if self.moves else 0.0,
+            'nodes': self.nodes,
+            'nodes_per_move': self.nodes / self.moves if self.moves else 0.0,
+        }
+
+
+def play_game(white, black, seed=0, max_moves=MAX_MOVES, repetitions=REPETITIONS):
+    """
+    Joue une partie complète entre deux joueurs (`parse_player`), les blancs
+    commençant. Retourne le compte rendu de la partie (dict sérialisable). Un
+    joueur dont le coup est refusé par le contrôleur perd par forfait
+    (`reason` « forfeit », message dans `error`).
+    """
+    controller = GameController()
+    board = controller.board
+    players = {'blanc': _Player(white, board, seed * 2), 'noir': _Player(black, board, seed * 2 + 1)}
+    seen = {}
+    winner = None
+    reason = 'move-limit'
+    error = None
+    plies = 0
+    start = time.perf_counter()
+    while plies < max_moves:
+        if controller.game_over:
+            # Camp au trait bloqué ou sans pièce : il perd
+            winner = controller.winner
+            reason = 'no-moves'
+            break
+        color = controller.current_player
+        key = board.position_key(color)
+        seen[key] = seen.get(key, 0) + 1
+        if seen[key] >= repetitions:
+            reason = 'repetition'
+            break
+        move = players[color].play(board, controller.legal_moves(), color)
+        try:
+            if move is None:
+                raise IllegalMoveError(f"aucun coup proposé pour {color}")
+            controller.play(*move)
+        except IllegalMoveError as e:
+            # Coup refusé par le contrôleur : partie perdue par forfait, le tournoi continue
+            winner = opponent(color)
+            reason = 'forfeit'
+            error = str(e)
+            break
+        plies += 1
+    result = {'blanc': '1-0', 'noir': '0-1', None: '1/2-1/2'}[winner]
+    record = {
+        'type': 'game',
+        'white': white,
+        'black': black,
+        'seed': seed,
+        'result': result,
+        'winner': winner,
+        'reason': reason,
+        'plies': plies,
+        'duration': time.perf_counter() - start,
+        'pieces': {c: board.count(c) for c in ('blanc', 'noir')},
+        'stats': {'blanc': players['blanc'].stats(), 'noir': players['noir'].stats()},
+    }
+    if error is not None:
+        record['error'] = error
+    return record
+
+
+def _play_game_task(task):
+    index, white, black, seed, max_moves, repetitions = task
+    record = play_game(white, black, seed, max_moves, repetitions)
+    record['game'] = index
+    return record
+
+
+def schedule(players, games, seed=0):
+    """[(index, blancs, noirs, graine)] : `games` parties par paire, couleurs alternées."""
+    tasks = []
+    for a, b in combinations(players, 2):
+        for n in range(games):
+            white, black = (a, b) if n % 2 == 0 else (b, a)
+            tasks.append((len(tasks), white, black, seed + len(tasks)))
+    return tasks
+
+
+def _score(record, player):
+    """Points de `player` dans la partie (1, 0.5 ou 0)."""
+    if record['winner'] is None:
+        return 0.5
+    winning = record['white'] if record['winner'] == 'blanc' else record['black']
+    return 1.0 if winning == player else 0.0
+
+
+def elo_ratings(records, players, iterations=1000):
+    """
+    Estimation Elo au maximum de vraisemblance (modèle de Bradley-Terry, nulle =
+    une demi-victoire), moyenne ramenée à 0. Une nulle fictive entre chaque paire
+    qui a joué évite les valeurs infinies d'un joueur qui gagne ou perd tout.
+    """
+    index = {player: i for i, player in enumerate(players)}
+    n = len(players)
+    games = [[0.0] * n for _ in range(n)]
+    points = [0.0] * n
+    for record in records:
+        w, b = index[record['white']], index[record['black']]
+        games[w][b] += 1
+        games[b][w] += 1
+        points[w] += _score(record, record['white'])
+        points[b] += _score(record, record['black'])
+    for i in range(n):
+        for j in range(n):
+            if i != j and games[i][j]:
+                games[i][j] += 1
+                points[i] += 0.5
+    strength = [1.0] * n
+    for _ in range(iterations):
+        updated = []
+        for i in range(n):
+            denominator = sum(games[i][j] / (strength[i] + strength[j]) for j in range(n) if j != i and games[i][j])
+            updated.append(points[i] / denominator if denominator else strength[i])
+        # Normalisation géométrique : la moyenne des Elo reste nulle
+        mean = math.exp(sum(math.log(s) for s in updated) / n)
+        updated = [s / mean for s in updated]
+        converged = max(abs(u - s) for u, s in zip(updated, strength)) < 1e-9
+        strength = updated
+        if converged:
+            break
+    return {player: 400 * math.log10(strength[index[player]]) for player in players}
+
+
+def pair_summary(records, a, b):
+    """
+    Bilan de `a` contre `b` : victoires, nulles, défaites, écart Elo estimé
+    et sa marge d'erreur à 95 % (None si tous les résultats sont identiques).
+    """
+    scores = [_score(r, a) for r in records if {r['white'], r['black']} == {a, b}]
+    n = len(scores)
+    summary = {'a': a, 'b': b, 'games': n, 'wins': scores.count(1.0), 'draws': scores.count(0.5),
+               'losses': scores.count(0.0), 'score': None, 'elo_diff': None, 'elo_margin': None}
+    if not n:
+        return summary
+    score = sum(scores) / n
+    summary['score'] = score
+    # Score borné pour garder un écart fini quand un joueur gagne tout
+    bounded = min(max(score, 0.5 / n), 1 - 0.5 / n)
+    summary['elo_diff'] = -400 * math.log10(1 / bounded - 1)
+    deviation = math.sqrt(sum((s - score) ** 2 for s in scores) / n)
+    if not deviation:
+        # Résultats tous identiques : marge inconnue
+        return summary
+    summary['elo_margin'] = 400 / math.log(10) * 1.96 * (deviation / math.sqrt(n)) / (bounded * (1 - bounded))
+    return summary
+
+
+def run_tournament(players, games, output, workers=None, seed=0, max_moves=MAX_MOVES,
+                   repetitions=REPETITIONS, out=sys.stdout):
+    """
+    Joue le tournoi sur un pool de processus et écrit chaque partie dans
+    `output` (JSON lines) dès qu'elle est terminée, puis le résumé. Retourne le résumé.
+    """
+    tasks = [task + (max_moves, repetitions) for task in schedule(players, games, seed)]
+    workers = workers or os.cpu_count() or 1
+    records = []
+    start = time.perf_counter()
+    with open(output, 'w', encoding='utf-8') as f:
+        # Processus lancés en mode « spawn », comme le pool de la recherche parallèle
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = [executor.submit(_play_game_task, task) for task in tasks]
+            try:
+                for future in as_completed(futures):
+                    record = future.result()
+                    records.append(record)
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                    f.flush()
+                    print(f"[{len(records)}/{len(tasks)}] {record['white']} - {record['black']}  "
+                          f"{record['result']:<7} {record['reason']:<10} {record['plies']:>3} demi-coups", file=out)
+            except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
+                print("Tournoi interrompu : résumé des parties terminées", file=out)
+        summary = {
+            'type': 'summary',
+            'players': players,
+            'games': len(records),
+            'duration': time.perf_counter() - start,
+            'max_moves': max_moves,
+            'repetitions': repetitions,
+            'elo': elo_ratings(records, players) if records else {},
+            'pairs': [pair_summary(records, a, b) for a, b in combinations(players, 2)],
+        }
+        f.write(json.dumps(summary, ensure_ascii=False) + '\n')
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.tournament", description="Tournoi IA contre IA sans affichage.")
+    parser.add_argument('players', nargs='+', help="joueurs (au moins deux), ex. easy, medium, hard:nodes=5000, search:depth=4")
+    parser.add_argument('--games', type=int, default=100, help="parties par paire de joueurs (défaut : 100)")
+    parser.add_argument('--workers', type=int, default=None, help="processus (défaut : un par cœur)")
+    parser.add_argument('--output', default='tournament.jsonl', help="fichier JSON lines (défaut : tournament.jsonl)")
+    parser.add_argument('--seed', type=int, default=0, help="graine des niveaux facile et moyen (défaut : 0)")
+    parser.add_argument('--max-moves', type=int, default=MAX_MOVES, help=f"demi-coups avant la nulle (défaut : {MAX_MOVES})")
+    parser.add_argument('--repetitions', type=int, default=REPETITIONS,
+                        help=f"répétitions d'une position pour la nulle (défaut : {REPETITIONS})")
+    args = parser.parse_args(argv)
+
+    if len(args.players) < 2:
+        parser.error("il faut au moins deux joueurs")
+    if len(set(args.players)) != len(args.players):
+        parser.error("chaque joueur ne peut figurer qu'une fois")
+    if args.games < 1 or args.max_moves < 1 or args.repetitions < 2:
+        parser.error("--games et --max-moves doivent être positifs, --repetitions au moins 2")
+    for spec in args.players:
+        try:
+            parse_player(spec)
+        except ValueError as e:
+            parser.error(str(e))
+
+    summary = run_tournament(args.players, args.games, args.output, args.workers, args.seed,
+                             args.max_moves, args.repetitions)
+    print()
+    for player, elo in sorted(summary['elo'].items(), key=lambda item: -item[1]):
+        print(f"{player:<28} Elo {elo:+7.0f}")
+    for pair in summary['pairs']:
+        if pair['games']:
+            print(f"{pair['a']} contre {pair['b']} : +{pair['wins']} ={pair['draws']} -{pair['losses']}  "
+                  f"écart {pair['elo_diff']:+.0f}" + (f" ± {pair['elo_margin']:.0f}" if pair['elo_margin'] is not None else ""))
+    print(f"\nRésultats écrits dans {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
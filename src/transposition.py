@@ -0,0 +1,57 @@
+from src.constants import TT_MEMORY_MB
+
+# Types de borne stockés avec le score
+EXACT = 0
+LOWER = 1  # score >= valeur réelle connue (coupure beta)
+UPPER = 2  # score <= valeur réelle connue (aucun coup n'a dépassé alpha)
+
+# Estimation de l'empreinte mémoire d'une entrée (tuple + entiers + coup)
+ENTRY_BYTES = 160
+
+
+class TranspositionTable:
+    """
+    Table de transposition de taille fixe indexée par clé de Zobrist.
+
+    Chaque seau contient deux emplacements : l'un conserve l'entrée la plus
+    profonde (remplacement par profondeur), l'autre reçoit systématiquement la
+    dernière entrée écrite (remplacement inconditionnel).
+    Une entrée est un tuple (clé, profondeur, borne, score, meilleur coup).
+    """
+    def __init__(self, memory_mb=TT_MEMORY_MB):
+        buckets = max(1, int(memory_mb * 1024 * 1024) // (2 * ENTRY_BYTES))
+        # Nombre de seaux arrondi à la puissance de 2 inférieure pour indexer par masque
+        self.size = 1 << (buckets.bit_length() - 1)
+        self.mask = self.size - 1
+        self.deep = [None] * self.size
+        self.recent = [None] * self.size
+        self.hits = 0
+        self.probes = 0
+
+    def probe(self, key):
+        self.probes += 1
+        index = key & self.mask
+        entry = self.deep[index]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        entry = self.recent[index]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key, depth, bound, score, best_move):
+        index = key & self.mask
+        entry = (key, depth, bound, score, best_move)
+        deep = self.deep[index]
+        if deep is None or deep[0] == key or depth >= deep[1]:
+            self.deep[index] = entry
+        else:
+            self.recent[index] = entry
+
+    def clear(self):
+        self.deep = [None] * self.size
+        self.recent = [None] * self.size
+        self.hits = 0
+        self.probes = 0
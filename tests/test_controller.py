@@ -0,0 +1,17 @@
+"""
+Statistiques du contrôleur : `kings` compte les dames présentes sur le plateau
+(lu dans `Board.kings`), `promotions` les pions promus pendant la partie.
+"""
+from src.bitboard import position_from_fen
+from src.controller import GameController
+
+
+def test_stats_keep_king_count_apart_from_promotions():
+    position, color = position_from_fen("W:W6,K50:B45")
+    controller = GameController()
+    controller.set_position(position, color)
+    record = controller.play((1, 0), (0, 1), [])
+    assert record.promoted
+    # La dame déjà présente compte aussi : deux dames, une seule promotion
+    assert controller.stats['blanc'] == {'captures': 0, 'kings': 2, 'promotions': 1}
+    assert controller.stats['blanc']['kings'] == controller.board.kings['blanc']
@@ -0,0 +1,79 @@
+"""
+Cohérence des générateurs de prises : les coups produits pour la recherche
+(`iter_captures`, `iter_moves`) doivent être exactement les rafles maximales
+que l'interface et le contrôleur acceptent (`Board.get_capture_routes`).
+"""
+import random
+
+import pytest
+
+from src import bitboard
+from src.bitboard import Position, position_from_fen
+from src.board import Board
+from src.controller import GameController
+from src.move_cache import MoveCache
+
+# Positions où une rafle plus courte masquait la rafle maximale d'une même case
+FENS = [
+    "B:W10,11,12,18,20,23,K28,30,31,K32,43:B5,17,K33,34",
+    "B:WK2,K3,10,K14,15,K20,21,22,31,32,K35,K40,43,44,47:B4,5,24,K39,K49",
+]
+
+SQUARES = [bit for bit in range(64) if bitboard.on_board(bit)]
+
+
+def random_positions(count, seed=0x5EED):
+    """Positions aléatoires (pions et dames des deux camps), camp au trait compris."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        position = Position()
+        for bit in rng.sample(SQUARES, rng.randint(4, 24)):
+            position.put(bit, rng.choice(('blanc', 'noir')), rng.random() < 0.3)
+        yield position, rng.choice(('blanc', 'noir'))
+
+
+def search_captures(board, color):
+    return {(start, end, tuple(path)) for start, end, path in board.iter_captures(color)}
+
+
+def route_captures(board, color):
+    routes, _ = board.get_capture_routes(color)
+    return {(start, dest, tuple(path)) for start, paths in routes.items() for dest, path, _ in paths}
+
+
+@pytest.mark.parametrize("fen", FENS)
+def test_iter_captures_matches_capture_routes(fen):
+    position, color = position_from_fen(fen)
+    board = Board.from_position(position)
+    assert search_captures(board, color) == route_captures(board, color)
+
+
+@pytest.mark.parametrize("fen", FENS)
+def test_controller_accepts_every_generated_move(fen):
+    position, color = position_from_fen(fen)
+    for move in Board.from_position(position).iter_moves(color):
+        controller = GameController()
+        controller.set_position(position, color)
+        controller.play(*move)
+
+
+def test_iter_captures_matches_capture_routes_on_random_positions():
+    checked = 0
+    for position, color in random_positions(2000):
+        board = Board.from_position(position)
+        moves = list(board.iter_captures(color))
+        # Une rafle n'est produite qu'une fois
+        assert len(moves) == len(search_captures(board, color))
+        assert search_captures(board, color) == route_captures(board, color)
+        checked += bool(moves)
+    assert checked > 1000
+
+
+def test_turn_moves_match_search_moves_on_random_positions():
+    # Le cache du tour (interface) et la recherche de l'IA voient les mêmes coups
+    for position, color in random_positions(1000, seed=12):
+        board = Board.from_position(position)
+        turn = MoveCache(board).get(color)
+        moves = {(start, end, tuple(path)) for start, end, path in turn.move_list()}
+        assert len(moves) == len(turn.move_list())
+        assert moves == {(start, end, tuple(path)) for start, end, path in board.iter_moves(color)}
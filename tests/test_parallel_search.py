@@ -0,0 +1,69 @@
+"""Recherche parallèle à la racine : même résultat que la recherche séquentielle, repli sans le pool."""
+from concurrent.futures import Future
+
+import pytest
+
+from src import parallel_search
+from src.bitboard import position_from_fen
+from src.board import Board
+from src.parallel_search import ParallelSearch, shutdown_pool
+from src.search import Search
+from src.transposition import TranspositionTable
+
+FEN = "W:W26,27,34,35,36,37,40,41,42,45,46,49:B2,3,4,5,6,7,9,11,14,15,16,17,24,25,28"
+
+
+def _board():
+    position, color = position_from_fen(FEN)
+    return Board.from_position(position), color
+
+
+class _FailingExecutor:
+    """Pool dont chaque tâche échoue (processus mort, exception dans la tâche)."""
+    def submit(self, *args):
+        future = Future()
+        future.set_exception(RuntimeError("processus de recherche arrêté"))
+        return future
+
+
+@pytest.fixture
+def pool():
+    yield
+    shutdown_pool()
+
+
+def test_parallel_score_matches_serial(pool):
+    board, color = _board()
+    serial = Search(board, TranspositionTable(), time_budget=None, node_budget=None, max_depth=3)
+    serial.iterative_deepening(color)
+    board, color = _board()
+    parallel = ParallelSearch(board, TranspositionTable(), workers=2, time_budget=None, max_depth=3)
+    move = parallel.iterative_deepening(color)
+    assert parallel.completed_depth == 3
+    assert parallel.best_score == serial.best_score
+    assert move in list(board.iter_moves(color))
+
+
+def test_worker_failure_falls_back_to_serial_search(monkeypatch):
+    monkeypatch.setattr(parallel_search, 'get_executor', lambda workers: _FailingExecutor())
+    board, color = _board()
+    search = ParallelSearch(board, TranspositionTable(), workers=2, time_budget=None, max_depth=3)
+    move = search.iterative_deepening(color)
+    assert search.completed_depth == 3
+    assert search.best_score is not None
+    assert move in list(board.iter_moves(color))
+
+
+def test_first_iteration_is_searched_without_the_pool(monkeypatch):
+    # Pool qui ne répond jamais (processus encore en lancement) : la profondeur 1,
+    # cherchée dans ce processus, fournit tout de même un coup cherché
+    class _Stalled:
+        def submit(self, *args):
+            return Future()
+    monkeypatch.setattr(parallel_search, 'get_executor', lambda workers: _Stalled())
+    board, color = _board()
+    search = ParallelSearch(board, TranspositionTable(), workers=2, time_budget=0.2)
+    move = search.iterative_deepening(color)
+    assert search.completed_depth >= 1
+    assert search.best_score is not None
+    assert move in list(board.iter_moves(color))
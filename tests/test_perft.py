@@ -0,0 +1,33 @@
+"""Comptes de référence du perft (`src.perft.REFERENCE_COUNTS`), jusqu'à la profondeur 3."""
+import io
+
+import pytest
+
+from src import perft
+
+MAX_DEPTH = 3
+
+CASES = [(generator, name, fen, depth, expected)
+         for generator in perft.GENERATORS
+         for name, fen, counts in perft.REFERENCE_COUNTS
+         for depth, expected in sorted(counts.items()) if depth <= MAX_DEPTH]
+
+
+@pytest.mark.parametrize("generator,name,fen,depth,expected", CASES,
+                         ids=[f"{generator}-{name}-{depth}" for generator, name, _, depth, _ in CASES])
+def test_reference_counts(generator, name, fen, depth, expected):
+    assert perft.perft(fen, depth, generator) == expected
+
+
+def test_verify():
+    # Comptes de chaque générateur et divide identique entre générateurs
+    out = io.StringIO()
+    assert perft.verify(max_depth=MAX_DEPTH, out=out), out.getvalue()
+
+
+def test_two_routes_to_one_square_are_two_moves():
+    # Deux rafles maximales vers la même case, avec des pièces prises différentes
+    name, fen, counts = next(case for case in perft.REFERENCE_COUNTS if case[0] == "deux rafles vers une case")
+    divides = {generator: sorted(perft.divide(fen, 2, generator)) for generator in perft.GENERATORS}
+    assert len(divides['bitboard']) == counts[1]
+    assert all(result == divides['bitboard'] for result in divides.values())
@@ -0,0 +1,23 @@
+"""Tournoi sans affichage : un coup refusé par le contrôleur ne doit pas interrompre le tournoi."""
+from src import tournament
+
+
+def test_illegal_move_is_scored_as_forfeit(monkeypatch):
+    play = tournament._Player.play
+
+    def illegal_for_black(self, board, turn, color):
+        if color == 'noir':
+            return (0, 1), (9, 0), []
+        return play(self, board, turn, color)
+
+    monkeypatch.setattr(tournament._Player, 'play', illegal_for_black)
+    record = tournament.play_game('easy', 'easy', seed=1)
+    assert record['reason'] == 'forfeit'
+    assert record['winner'] == 'blanc' and record['result'] == '1-0'
+    assert record['plies'] == 1
+    assert 'error' in record
+
+
+def test_search_player_plays_capture_turns():
+    record = tournament.play_game('search:depth=2', 'medium', seed=3, max_moves=60)
+    assert record['reason'] != 'forfeit'